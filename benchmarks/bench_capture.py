@@ -0,0 +1,267 @@
+"""Micro-benchmarks for the pytest-structlog capture hot path and assertion helpers.
+
+Run with ``python benchmarks/bench_capture.py``. Each line reports the best time per
+operation over several repeats, so that performance regressions in the plugin become
+visible when comparing runs (e.g. before and after a change, on the same machine).
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from types import SimpleNamespace
+from typing import Any
+from typing import Callable
+from unittest.mock import ANY
+
+import pytest
+import structlog
+
+import pytest_structlog
+from pytest_structlog import EventList
+from pytest_structlog import StructuredLogCapture
+
+
+def report(name: str, seconds: float, unit: str = "op") -> None:
+    if seconds < 1e-3:
+        text = f"{seconds * 1e6:10.3f} us"
+    elif seconds < 1:
+        text = f"{seconds * 1e3:10.3f} ms"
+    else:
+        text = f"{seconds:10.3f} s "
+    print(f"{name:<60}{text}/{unit}")
+
+
+def bench(name: str, func: Callable[[], Any], repeat: int = 3) -> None:
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    report(name, best)
+
+
+def make_events(n: int) -> EventList:
+    events = EventList()
+    for i in range(n):
+        events.append({"event": f"event-{i % 50}", "level": "info", "i": i, "k": "v"})
+    return events
+
+
+def bench_capture_call() -> None:
+    for add_log_level in True, False:
+        capture = StructuredLogCapture()
+        capture._add_log_level = add_log_level
+        logger_factory = pytest_structlog._CaptureLoggerFactory(structlog.PrintLogger)
+        structlog.configure(
+            processors=[capture],
+            logger_factory=logger_factory,
+            cache_logger_on_first_use=False,
+        )
+        logger = structlog.get_logger().bind(k="v")
+        try:
+            bench(
+                f"log.info via capture logger (add_log_level={add_log_level})",
+                lambda: logger.info("hello", i=1),
+            )
+            dropping_logger = structlog.wrap_logger(structlog.PrintLogger()).bind(k="v")
+            bench(
+                f"log.info via DropEvent (add_log_level={add_log_level})",
+                lambda: dropping_logger.info("hello", i=1),
+            )
+            event_dict = {"event": "hello", "k": "v"}
+            capture_logger = logger_factory()
+            bench(
+                f"StructuredLogCapture.__call__ (add_log_level={add_log_level})",
+                lambda: capture(capture_logger, "info", event_dict),
+            )
+        finally:
+            capture._reset()
+    capture = StructuredLogCapture(storage="count")
+    bench(
+        "StructuredLogCapture.__call__ (storage=count)",
+        lambda: capture(capture_logger, "info", event_dict),
+    )
+    capture = StructuredLogCapture()
+    capture._waiters.append(pytest_structlog._Waiter(capture.matcher("never")))
+    bench(
+        "StructuredLogCapture.__call__ (1 waiter, not matching)",
+        lambda: capture(capture_logger, "info", event_dict),
+    )
+
+
+def bench_helpers(sizes: list[int]) -> None:
+    for n in sizes:
+        capture = StructuredLogCapture()
+        capture.events.extend(make_events(n))
+        last = f"event-{(n - 1) % 50}"
+        bench(
+            f"has, hit on last event ({n} events)", lambda: capture.has(last, i=n - 1)
+        )
+        bench(f"has, miss ({n} events)", lambda: capture.has("event-0", i=-1))
+        bench(f"has, unindexable query ({n} events)", lambda: capture.has(ANY, i=[0]))
+        bench(f"count ({n} events)", lambda: capture.count("event-0", k="v"))
+        step = capture.checkpoint()
+        step.offset -= 10
+        since = capture.since(step)
+        bench(
+            f"has since last 10 events, unindexable query ({n} events)",
+            lambda: since.has(ANY, i=[0]),
+        )
+        matcher = capture.matcher("event-0", k="v")
+        bench(f"count with matcher ({n} events)", lambda: capture.count(matcher))
+        query = capture.where(event="event-0", k="v")
+        bench(f"where(...).count() ({n} events)", query.count)
+        bench(f"where(...).values() ({n} events)", lambda: query.values("i"))
+
+
+def bench_threaded(sizes: list[int]) -> None:
+    for n in sizes:
+        events = pytest_structlog.ThreadedEventList()
+        for event_dict in make_events(n):
+            events.append(event_dict)
+        bench(f"ThreadedEventList events[i] ({n} events)", lambda: events[n // 2])
+
+
+def bench_subsequence(sizes: list[int]) -> None:
+    for n in sizes:
+        events = make_events(n)
+        step = max(n // 50, 1)
+        expected = [dict(e) for e in events[::step]]
+        unordered = expected[::-1]
+        bench(
+            f"EventList >= 50 expected events ({n} events)", lambda: events >= expected
+        )
+        bench(
+            f"EventList <= 50 expected events ({n} events)", lambda: expected <= events
+        )
+        bench(f"EventList >= out of order ({n} events)", lambda: events >= unordered)
+        bench(f"EventList > 50 expected events ({n} events)", lambda: events > expected)
+
+
+def bench_report_section(sizes: list[int]) -> None:
+    config = SimpleNamespace(
+        pluginmanager=SimpleNamespace(get_plugin=lambda name: None)
+    )
+    for failed in False, True:
+        for n in sizes:
+            item = SimpleNamespace(
+                config=config,
+                structlog_events=make_events(n),
+                add_report_section=lambda when, key, content: None,
+            )
+            outcome = SimpleNamespace(excinfo=object() if failed else None)
+
+            def run() -> None:
+                hook = pytest_structlog.pytest_runtest_call(item)
+                next(hook)
+                try:
+                    hook.send(outcome)
+                except StopIteration:
+                    pass
+
+            result = "failed" if failed else "passed"
+            bench(f"pytest_runtest_call report section ({result}, {n} events)", run)
+
+
+FIXTURE_TESTS = """
+import pytest
+
+@pytest.mark.parametrize("i", range({n}))
+def test_with_log(i, {fixture}):
+    pass
+"""
+
+
+class SetupTimer:
+    """Plugin timing the setup and teardown of each test."""
+
+    def __init__(self) -> None:
+        self.seconds: dict[pytest.Item, float] = collections.defaultdict(float)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item: pytest.Item) -> Any:
+        start = time.perf_counter()
+        yield
+        self.seconds[item] += time.perf_counter() - start
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item: pytest.Item) -> Any:
+        start = time.perf_counter()
+        yield
+        self.seconds[item] += time.perf_counter() - start
+
+    def median(self, module: str) -> float:
+        return statistics.median(
+            t for item, t in self.seconds.items() if item.module.__name__ == module
+        )
+
+
+def bench_fixture(n: int) -> None:
+    """Per-test cost of the log fixtures, by timing the setup and teardown of trivial
+    tests in an in-process pytest session, compared with tests using no log fixture.
+    The median per test is used, so that one-off costs (e.g. importing structlog, or
+    the first test of a module) and outliers don't count."""
+    fixtures = "request", "log", "log_module", "log_session"
+    timings = dict.fromkeys(fixtures, float("inf"))
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for fixture in fixtures:
+            path = os.path.join(tmp, f"test_{fixture}.py")
+            with open(path, "w") as f:
+                f.write(FIXTURE_TESTS.format(n=n, fixture=fixture))
+            paths.append(path)
+        args = ["-p", "no:cacheprovider", "-p", "no:terminal", *paths]
+        for _ in range(5):
+            structlog.reset_defaults()
+            timer = SetupTimer()
+            if pytest.main(args, plugins=[timer]) != pytest.ExitCode.OK:
+                raise RuntimeError("the fixture benchmark tests failed")
+            for fixture in fixtures:
+                median = timer.median(f"test_{fixture}")
+                timings[fixture] = min(timings[fixture], median)
+    structlog.reset_defaults()
+    for fixture in fixtures[1:]:
+        cost = timings[fixture] - timings["request"]
+        report(f"{fixture} fixture setup + teardown", cost, "test")
+
+
+def bench_import() -> None:
+    """Cost of importing the plugin module on top of pytest itself, as reported by
+    ``python -X importtime``. This is paid by every pytest run with the plugin
+    installed, whether or not any test uses the log fixture."""
+    cmd = [sys.executable, "-X", "importtime", "-c", "import pytest, pytest_structlog"]
+    best = float("inf")
+    for _ in range(9):
+        proc = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        for line in proc.stderr.splitlines():
+            if line.endswith("| pytest_structlog"):
+                best = min(best, int(line.split("|")[1]) / 1e6)
+    report("import pytest_structlog", best, "import")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="smaller sizes only, for a fast sanity check",
+    )
+    args = parser.parse_args()
+    sizes = [1000] if args.quick else [1000, 100_000]
+    bench_capture_call()
+    bench_helpers(sizes)
+    bench_threaded(sizes)
+    bench_subsequence(sizes)
+    bench_report_section(sizes)
+    bench_fixture(100 if args.quick else 1000)
+    bench_import()
+
+
+if __name__ == "__main__":
+    main()
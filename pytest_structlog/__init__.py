@@ -1,33 +1,239 @@
 from __future__ import annotations
 
+import array
+import atexit
+import bisect
+import collections
 import functools
+import heapq
+import importlib
+import itertools
+import json
 import logging
+import mmap
+import operator
 import os
+import re
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+import time
+import warnings
+from collections import deque
 from typing import Any
 from typing import Callable
+from typing import Dict
 from typing import Generator
+from typing import Iterable
+from typing import Iterator
 from typing import List
-from typing import NoReturn
+from typing import Mapping
+from typing import MutableMapping
+from typing import Optional
 from typing import Sequence
+from typing import Sized
+from typing import SupportsIndex
+from typing import TYPE_CHECKING
+from typing import Tuple
 from typing import Union
+from typing import overload
 
 import pytest
-import structlog
 from pytest import FixtureRequest
 from pytest import MonkeyPatch
-from structlog.contextvars import clear_contextvars
-from structlog.typing import EventDict
-from structlog.typing import WrappedLogger
 
 
-class EventList(List[EventDict]):
-    """A list subclass that overrides ordering operations.
+class _LazyModule:
+    """Stands in for a module until it's first used, then imports it and replaces
+    itself with the module in the globals of pytest_structlog. This keeps the plugin
+    cheap to load in test runs which never capture anything."""
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __getattr__(self, attr: str) -> Any:
+        module = importlib.import_module(self._name)
+        globals()[self._name] = module
+        return getattr(module, attr)
+
+
+if TYPE_CHECKING:
+    import asyncio
+    import selectors
+    import socket
+
+    import structlog
+    from structlog.typing import EventDict
+    from structlog.typing import WrappedLogger
+else:
+    structlog = _LazyModule("structlog")
+    EventDict = MutableMapping[str, Any]
+    WrappedLogger = Any
+
+# Value types which hash consistently with their equality, and so can be looked up
+# in the event index. Anything else (including subclasses, whose __eq__ may have been
+# overridden) is treated as unindexable and must be checked by scanning.
+_PLAIN_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+# Below this many events, a linear scan is cheaper than building the index.
+_INDEX_THRESHOLD = 100
+
+
+def _immutable(self: Any, *args: Any, **kwargs: Any) -> Any:
+    raise TypeError(f"{type(self).__name__} is immutable")
+
+
+class FrozenEvent(Dict[Any, Any]):
+    """Immutable, hashable, event dict stored by captures with copy="frozen". Nested
+    dicts, lists and sets are frozen too (as FrozenEvent, a list which can't be
+    modified, and frozenset), so that they still compare equal to the originals.
+    It is hashable as long as all of the values are."""
+
+    __slots__ = ("_hash",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        items = dict(*args, **kwargs).items()
+        super().__init__((k, _freeze(v)) for k, v in items)
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash: int = hash(frozenset(self.items()))
+            return self._hash
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (dict(self),)
+
+    def __copy__(self) -> FrozenEvent:
+        return self
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+
+class _FrozenList(List[Any]):
+    """A list which can't be modified, and so can be hashed, for the list values of
+    a FrozenEvent. Unlike a tuple, it is still equal to the original list."""
+
+    __slots__ = ()
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(tuple(self))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (list(self),)
+
+    def __copy__(self) -> _FrozenList:
+        return self
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+
+
+def _freeze(value: Any) -> Any:
+    t = type(value)
+    if t in _PLAIN_TYPES or t is FrozenEvent or t is _FrozenList:
+        return value
+    if isinstance(value, dict):
+        return FrozenEvent(value)
+    if isinstance(value, list):
+        return _FrozenList(map(_freeze, value))
+    if t is tuple:
+        return tuple(map(_freeze, value))
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+# Immutable value types which hash consistently with their equality, if all their
+# items are hashable. They're indexable when they are.
+_FROZEN_TYPES = frozenset({tuple, frozenset, FrozenEvent, _FrozenList})
+
+
+def _indexable(value: Any) -> bool:
+    t = type(value)
+    if t in _PLAIN_TYPES:
+        return True
+    if t not in _FROZEN_TYPES:
+        return False
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+class _EventIndex:
+    """Positions of events within an EventList, keyed by (key, value) pairs.
+    Pairs with unindexable values are recorded per-key as "loose" positions, which
+    are always candidates for a match on that key. Events appended to the list
+    are indexed lazily, when the index is next used (see update)."""
+
+    __slots__ = ("pairs", "loose", "size", "lock")
+
+    def __init__(self) -> None:
+        self.pairs: dict[tuple[Any, Any], list[int]] = {}
+        self.loose: dict[Any, list[int]] = {}
+        # the number of events indexed so far
+        self.size = 0
+        self.lock = threading.Lock()
+
+    def update(self, events: list[EventDict]) -> None:
+        """Index the events appended since the last update. Appends don't touch the
+        index, so events logged concurrently by other threads can't be indexed
+        under the wrong positions."""
+        with self.lock:
+            n = len(events)
+            for i in range(self.size, n):
+                self.add(i, list.__getitem__(events, i))
+            self.size = n
+
+    def add(self, i: int, event_dict: EventDict) -> None:
+        for k, v in event_dict.items():
+            if _indexable(v):
+                self.pairs.setdefault((k, v), []).append(i)
+            else:
+                self.loose.setdefault(k, []).append(i)
+
+    def positions(self, context: Mapping[Any, Any]) -> Optional[List[int]]:
+        """Sorted positions of the events which could be a supermap of context, using
+        the most selective key. Returns None if no key in context is indexable."""
+        best: Optional[tuple[Sequence[int], Sequence[int]]] = None
+        best_size = 0
+        for k, v in context.items():
+            if not _indexable(v):
+                continue
+            exact: Sequence[int] = self.pairs.get((k, v), ())
+            loose: Sequence[int] = self.loose.get(k, ())
+            size = len(exact) + len(loose)
+            if best is None or size < best_size:
+                best = exact, loose
+                best_size = size
+        if best is None:
+            return None
+        exact, loose = best
+        if not loose:
+            return list(exact)
+        return list(heapq.merge(exact, loose))
+
+
+class _SubseqOrdering:
+    """Mixin for event sequences which overrides ordering operations.
     Instead of A <= B being a lexicographical comparison,
     now it means every element of A is contained within B,
     in the same order, although there may be other items
     interspersed throughout (i.e. A is a subsequence of B)
     """
 
+    if TYPE_CHECKING:
+
+        def __len__(self) -> int: ...
+
+        def __iter__(self) -> Iterator[EventDict]: ...
+
     def __ge__(self, other: Sequence[EventDict]) -> bool:
         return is_subseq(other, self)
 
@@ -41,6 +247,479 @@ class EventList(List[EventDict]):
         return len(self) < len(other) and is_subseq(self, other)
 
 
+class EventList(_SubseqOrdering, List[EventDict]):
+    """A list subclass that overrides ordering operations.
+    Instead of A <= B being a lexicographical comparison,
+    now it means every element of A is contained within B,
+    in the same order, although there may be other items
+    interspersed throughout (i.e. A is a subsequence of B)
+    """
+
+    _index: Optional[_EventIndex] = None
+
+    def __copy__(self) -> EventList:
+        return type(self)(self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # the index is derived state, it should not be shared or serialized
+        return type(self), (list(self),)
+
+    def _candidates(
+        self, context: Mapping[Any, Any], start: int = 0
+    ) -> Iterable[EventDict]:
+        """Events (from position start) which may be a supermap of context, narrowed
+        down using the index. The index is built on first use, and catches up with
+        the appended events whenever it's used."""
+        if self._index is None and len(self) < _INDEX_THRESHOLD:
+            return self[start:] if start else self
+        positions = self._indexed().positions(context)
+        if positions is None:
+            return map(self.__getitem__, range(start, len(self)))
+        if start:
+            positions = positions[bisect.bisect_left(positions, start) :]
+        return map(self.__getitem__, positions)
+
+    def _find(self, item: Any, start: int) -> int:
+        """Position of the first event equal to item, at or after start, or -1.
+        Uses the index if it has already been built, because building it just for
+        this would cost more than a scan."""
+        if isinstance(item, dict):
+            value = item.get("event", _absent)
+        elif isinstance(item, EventMatcher):
+            value = item._event
+        else:
+            value = _absent
+        if self._index is not None and type(value) in _PLAIN_TYPES:
+            index = self._indexed()
+            exact = index.pairs.get(("event", value), [])
+            loose = index.loose.get("event", [])
+            exact_tail = exact[bisect.bisect_left(exact, start) :]
+            loose_tail = loose[bisect.bisect_left(loose, start) :]
+            for i in heapq.merge(exact_tail, loose_tail):
+                event_dict = list.__getitem__(self, i)
+                if event_dict is item or event_dict == item:
+                    return i
+            return -1
+        try:
+            return self.index(item, start)
+        except ValueError:
+            return -1
+
+    def _indexed(self) -> _EventIndex:
+        """The index, built if necessary, and up to date with the appended events."""
+        index = self._index
+        if index is None:
+            index = self._index = _EventIndex()
+        index.update(self)
+        return index
+
+    # Appended events are indexed when the index is next used, any other mutation
+    # discards it.
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._index = None
+
+    def __delitem__(self, key: Union[SupportsIndex, slice]) -> None:
+        super().__delitem__(key)
+        self._index = None
+
+    def __imul__(self, n: SupportsIndex) -> EventList:
+        self._index = None
+        return super().__imul__(n)
+
+    def insert(self, i: SupportsIndex, event_dict: EventDict) -> None:
+        super().insert(i, event_dict)
+        self._index = None
+
+    def pop(self, i: SupportsIndex = -1) -> EventDict:
+        self._index = None
+        return super().pop(i)
+
+    def remove(self, event_dict: EventDict) -> None:
+        super().remove(event_dict)
+        self._index = None
+
+    def clear(self) -> None:
+        super().clear()
+        self._index = None
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._index = None
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._index = None
+
+
+class _EventSequence(_SubseqOrdering, Sequence[EventDict]):
+    """Base for the alternative event storage used by some capture modes. These
+    compare and slice like an EventList, but are not list subclasses."""
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def _get(self, i: int) -> EventDict:
+        raise NotImplementedError  # pragma: no cover
+
+    def __len__(self) -> int:
+        raise NotImplementedError  # pragma: no cover
+
+    def append(self, event_dict: EventDict) -> None:
+        raise NotImplementedError  # pragma: no cover
+
+    def clear(self) -> None:
+        raise NotImplementedError  # pragma: no cover
+
+    @overload
+    def __getitem__(self, i: int) -> EventDict: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> list[EventDict]: ...
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[EventDict, list[EventDict]]:
+        if isinstance(i, slice):
+            return [self._get(j) for j in range(*i.indices(len(self)))]
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return self._get(i)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (list, _EventSequence)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def _candidates(self, context: Mapping[Any, Any]) -> Iterable[EventDict]:
+        return self
+
+    def _iter_from(self, start: int) -> Iterator[EventDict]:
+        """The events from position start on. Storage which can skip ahead without
+        materializing the events before start overrides this."""
+        return itertools.islice(iter(self), start, None)
+
+
+def _event_size(event_dict: EventDict) -> int:
+    """Shallow estimate of the memory retained by an event dict."""
+    return sys.getsizeof(event_dict) + sum(map(sys.getsizeof, event_dict.values()))
+
+
+class BoundedEventList(_EventSequence):
+    """A window over only the most recent events, used when the capture is limited
+    with max_events and/or max_bytes. Older events are discarded as new ones arrive,
+    and the number discarded is recorded in the ``dropped`` attribute."""
+
+    def __init__(
+        self, max_events: Optional[int] = None, max_bytes: Optional[int] = None
+    ) -> None:
+        self.max_events = max_events
+        self.max_bytes = max_bytes
+        self.dropped: int = 0
+        self.nbytes: int = 0
+        self._events: deque[EventDict] = deque(maxlen=max_events)
+        self._sizes: deque[int] = deque()
+
+    @property
+    def truncated(self) -> bool:
+        """Whether any events have been discarded from this window."""
+        return self.dropped > 0
+
+    def append(self, event_dict: EventDict) -> None:
+        if len(self._events) == self.max_events:
+            # the deque discards the oldest event by itself
+            self.dropped += 1
+            if self.max_bytes is not None:
+                self.nbytes -= self._sizes.popleft()
+        self._events.append(event_dict)
+        if self.max_bytes is not None:
+            size = _event_size(event_dict)
+            self._sizes.append(size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes and len(self._events) > 1:
+                self._events.popleft()
+                self.nbytes -= self._sizes.popleft()
+                self.dropped += 1
+
+    def clear(self) -> None:
+        self._events.clear()
+        self._sizes.clear()
+        self.nbytes = 0
+        self.dropped = 0
+
+    def _get(self, i: int) -> EventDict:
+        return self._events[i]
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self) -> Iterator[EventDict]:
+        return iter(self._events)
+
+
+class _EventRecord:
+    """Compact form of an event dict: a shared, interned, tuple of keys and a tuple
+    of the corresponding values."""
+
+    __slots__ = ("keys", "values")
+
+    def __init__(self, keys: tuple[Any, ...], values: tuple[Any, ...]) -> None:
+        self.keys = keys
+        self.values = values
+
+
+class CompactEventList(_EventSequence):
+    """Event storage which keeps each event as a __slots__ record rather than the
+    event dict itself, with the keys interned and shared between all events of the
+    same shape. Event dicts are rebuilt whenever they're accessed, so modifying an
+    event dict taken from this list does not change the stored event."""
+
+    def __init__(self) -> None:
+        self._records: list[_EventRecord] = []
+        self._shapes: dict[tuple[Any, ...], tuple[Any, ...]] = {}
+
+    def append(self, event_dict: EventDict) -> None:
+        keys = tuple(event_dict)
+        shape = self._shapes.get(keys)
+        if shape is None:
+            shape = tuple(sys.intern(k) if type(k) is str else k for k in keys)
+            self._shapes[shape] = shape
+        self._records.append(_EventRecord(shape, tuple(event_dict.values())))
+
+    def clear(self) -> None:
+        self._records.clear()
+
+    def _get(self, i: int) -> EventDict:
+        record = self._records[i]
+        return dict(zip(record.keys, record.values))
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[EventDict]:
+        return self._iter_from(0)
+
+    def _iter_from(self, start: int) -> Iterator[EventDict]:
+        for record in itertools.islice(self._records, start, None):
+            yield dict(zip(record.keys, record.values))
+
+
+class ThreadedEventList(_EventSequence):
+    """Event storage for code under test which logs from many threads at once. Each
+    thread appends to its own buffer, tagging events with a sequence number and the
+    thread's identifier, and the buffers are merged into sequence order on read."""
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._buffers: list[list[tuple[int, int, EventDict]]] = []
+        self._seq = itertools.count()
+        self._merged: list[tuple[int, int, EventDict]] = []
+
+    def _buffer(self) -> list[tuple[int, int, EventDict]]:
+        buffer: list[tuple[int, int, EventDict]] = []
+        self._local.buffer = buffer
+        with self._lock:
+            self._buffers.append(buffer)
+        return buffer
+
+    def append(self, event_dict: EventDict) -> None:
+        try:
+            buffer = self._local.buffer
+        except AttributeError:
+            buffer = self._buffer()
+        buffer.append((next(self._seq), threading.get_ident(), event_dict))
+
+    def clear(self) -> None:
+        with self._lock:
+            for buffer in self._buffers:
+                buffer.clear()
+            self._merged = []
+
+    def records(self) -> list[tuple[int, int, EventDict]]:
+        """All events as (sequence number, thread identifier, event dict) tuples, in
+        sequence order."""
+        with self._lock:
+            # the merge is only redone when there are new events, counting them
+            # is cheap (one len per thread) and doesn't need to copy the buffers
+            if sum(map(len, self._buffers)) != len(self._merged):
+                buffers = [buffer[:] for buffer in self._buffers]
+                key = operator.itemgetter(0)
+                self._merged = list(heapq.merge(*buffers, key=key))
+            return self._merged
+
+    def for_thread(self, ident: int) -> EventList:
+        """The events logged by the thread with the given identifier."""
+        return EventList(e for _, tid, e in self.records() if tid == ident)
+
+    def _get(self, i: int) -> EventDict:
+        return self.records()[i][2]
+
+    def __len__(self) -> int:
+        return len(self.records())
+
+    def __iter__(self) -> Iterator[EventDict]:
+        return self._iter_from(0)
+
+    def _iter_from(self, start: int) -> Iterator[EventDict]:
+        # merges the buffers once, rather than for every event
+        return map(operator.itemgetter(2), self.records()[start:])
+
+
+def _json_safe(event_dict: Mapping[Any, Any]) -> dict[str, Any]:
+    """The event with keys which aren't str, and values which JSON can't represent
+    even with their repr as the default, replaced by their repr."""
+    result = {}
+    for k, v in event_dict.items():
+        if not isinstance(k, str):
+            k = repr(k)
+        try:
+            json.dumps(v, default=repr)
+        except (TypeError, ValueError):
+            v = repr(v)
+        result[k] = v
+    return result
+
+
+class SpillEventList(_EventSequence):
+    """Event storage which streams events to a temporary file as JSON lines, so that
+    memory use stays flat however many events are logged (only the offset of each
+    line is kept in memory). Events are decoded from the file when accessed, so they
+    are the JSON round-trip of the captured event dicts: values which JSON can not
+    represent are stored as their repr, and tuples come back as lists."""
+
+    def __init__(self) -> None:
+        self._file = tempfile.TemporaryFile(prefix="pytest-structlog-")
+        self._offsets = array.array("Q")
+        self._size = 0
+        self._map: Optional[mmap.mmap] = None
+
+    def append(self, event_dict: EventDict) -> None:
+        try:
+            text = json.dumps(event_dict, default=repr)
+        except (TypeError, ValueError):
+            # keys which aren't str etc (default does not apply to those), or
+            # circular references: nothing logged should fail because of the capture
+            text = json.dumps(_json_safe(event_dict))
+        line = text.encode() + b"\n"
+        self._file.write(line)
+        self._offsets.append(self._size)
+        self._size += len(line)
+
+    def clear(self) -> None:
+        self._file.seek(0)
+        self._file.truncate()
+        self._offsets = array.array("Q")
+        self._size = 0
+        self._map = None
+
+    def close(self) -> None:
+        """Delete the temporary file. The events can not be accessed afterwards."""
+        self._map = None
+        self._file.close()
+
+    def _view(self) -> mmap.mmap:
+        """A read-only memory map of all events written so far."""
+        if self._map is None or len(self._map) != self._size:
+            self._file.flush()
+            self._map = mmap.mmap(
+                self._file.fileno(), self._size, access=mmap.ACCESS_READ
+            )
+        return self._map
+
+    def _lines(self, start: int = 0) -> Iterator[bytes]:
+        n = len(self._offsets)
+        if start >= n:
+            return
+        view = self._view()
+        offsets = self._offsets
+        for i in range(start, n - 1):
+            yield view[offsets[i] : offsets[i + 1]]
+        yield view[offsets[n - 1] : self._size]
+
+    def _get(self, i: int) -> EventDict:
+        view = self._view()
+        end = self._offsets[i + 1] if i + 1 < len(self._offsets) else self._size
+        result: EventDict = json.loads(view[self._offsets[i] : end])
+        return result
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __iter__(self) -> Iterator[EventDict]:
+        return map(json.loads, self._lines())
+
+    def _iter_from(self, start: int) -> Iterator[EventDict]:
+        return map(json.loads, self._lines(start))
+
+    def _candidates(self, context: Mapping[Any, Any]) -> Iterable[EventDict]:
+        # Events with a str value for a key are sure to contain this encoding of the
+        # pair, so lines without it can be skipped before decoding them.
+        needles = [
+            f"{json.dumps(k)}: {json.dumps(v)}".encode()
+            for k, v in context.items()
+            if type(k) is str and type(v) is str
+        ]
+        for line in self._lines():
+            if all(needle in line for needle in needles):
+                yield json.loads(line)
+
+
+class CountingEventList(_EventSequence):
+    """Event storage which keeps no events at all, only the number of events logged
+    (the length of this sequence). For tests which use the log fixture for the way it
+    configures structlog, but never inspect the events: logging costs next to nothing.
+    Reading the events raises RuntimeError, rather than giving misleading results."""
+
+    def __init__(self) -> None:
+        self._n = 0
+
+    def append(self, event_dict: EventDict) -> None:
+        self._n += 1
+
+    def clear(self) -> None:
+        self._n = 0
+
+    def _not_kept(self) -> RuntimeError:
+        return RuntimeError(
+            "events are only counted by the capture (storage='count'), not kept"
+        )
+
+    def _get(self, i: int) -> EventDict:
+        raise self._not_kept()
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __iter__(self) -> Iterator[EventDict]:
+        raise self._not_kept()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: {self._n} events>"
+
+
+_STORAGE: dict[str, Callable[[], _EventSequence]] = {
+    "compact": CompactEventList,
+    "threaded": ThreadedEventList,
+    "spill": SpillEventList,
+    "count": CountingEventList,
+}
+_STORAGE_CHOICES = ("list", *_STORAGE)
+
+
+class TruncatedCaptureWarning(pytest.PytestWarning):
+    """Emitted by the assertion helpers when the capture has discarded some events,
+    which may cause them to give a different answer than an unlimited capture."""
+
+
 _absent = object()
 
 
@@ -51,27 +730,760 @@ def level_to_name(level: Union[str, int]) -> str:
     return logging.getLevelName(level).lower()
 
 
+def _normalize_level(context: dict[str, Any]) -> None:
+    """Convert a level in query context (by name in any case, or by number) to the
+    lower-case name it appears as in captured events. Other level values, such as a
+    function or ``mock.ANY``, are left as they are."""
+    level = context.get("level")
+    if type(level) is int or isinstance(level, str):
+        context["level"] = level_to_name(level)
+
+
 def is_submap(d1: EventDict, d2: EventDict) -> bool:
     """Is every pair from d1 also in d2? (unique and order insensitive)"""
     return all(d2.get(k, _absent) == v for k, v in d1.items())
 
 
-def is_subseq(l1: Sequence[Any], l2: Sequence[Any]) -> bool:
+def _search(pattern: re.Pattern[str], value: Any) -> bool:
+    return isinstance(value, str) and pattern.search(value) is not None
+
+
+class EventMatcher:
+    """A predicate for event dicts, compiled once and reusable in ``log.has``,
+    ``log.count`` and ``log.where``, and in place of an event dict when comparing
+    with ``log.events`` (a matcher is equal to the event dicts it matches).
+
+    Values are compared for equality, which includes e.g. ``pytest.approx``, except
+    for compiled regular expressions (which must be found in a str value, as with
+    ``re.search``) and functions (which are called with the value, and must return a
+    true result). The checks are ordered so that the most selective and cheapest
+    ones run first: plain values (the event name first), then other values, then
+    regular expressions, then functions."""
+
+    __slots__ = ("_checks", "_equal", "_tests", "_index_context", "_event")
+
+    def __init__(self, event: Any, **context: Any) -> None:
+        context["event"] = event
+        _normalize_level(context)
+        self._compile(context.items(), tests=True)
+
+    @classmethod
+    def _of(cls, pairs: Iterable[tuple[Any, Any]]) -> EventMatcher:
+        """A matcher comparing all values of pairs for equality, like is_submap."""
+        self = cls.__new__(cls)
+        self._compile(pairs, tests=False)
+        return self
+
+    def _compile(self, pairs: Iterable[tuple[Any, Any]], tests: bool) -> None:
+        checks = []
+        for k, v in pairs:
+            test: Optional[Callable[[Any], Any]] = None
+            if tests and isinstance(v, re.Pattern):
+                test, rank = functools.partial(_search, v), 3
+            elif tests and callable(v) and not isinstance(v, type):
+                test, rank = v, 4
+            elif type(v) in _PLAIN_TYPES:
+                rank = 0 if k == "event" else 1
+            else:
+                rank = 2
+            checks.append((rank, k, v, test))
+        checks.sort(key=operator.itemgetter(0))
+        self._checks = tuple((k, v, test) for _, k, v, test in checks)
+        self._equal = tuple((k, v) for k, v, test in self._checks if test is None)
+        self._tests = tuple((k, test) for k, _, test in self._checks if test)
+        # the pairs which an event index can narrow down the candidates with
+        self._index_context = {k: v for k, v in self._equal if _indexable(v)}
+        self._event = self._index_context.get("event", _absent)
+
+    def __call__(self, event_dict: Mapping[Any, Any]) -> bool:
+        get = event_dict.get
+        for k, v in self._equal:
+            if get(k, _absent) != v:
+                return False
+        for k, test in self._tests:
+            value = get(k, _absent)
+            if value is _absent or not test(value):
+                return False
+        return True
+
+    def _failures(self, event_dict: Mapping[Any, Any]) -> list[tuple[Any, Any]]:
+        """The (key, expected value) pairs which event_dict does not match."""
+        result = []
+        for k, v, test in self._checks:
+            value = event_dict.get(k, _absent)
+            if test is None:
+                ok = value == v
+            else:
+                ok = value is not _absent and bool(test(value))
+            if not ok:
+                result.append((k, v))
+        return result
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Mapping):
+            return self(other)
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        if isinstance(other, Mapping):
+            return not self(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        context = ", ".join(f"{k}={v!r}" for k, v, _ in self._checks)
+        return f"{type(self).__name__}({context})"
+
+
+def is_subseq(l1: Iterable[Any], l2: Iterable[Any]) -> bool:
     """Is every element of l1 also in l2? (non-unique and order sensitive)"""
-    it = iter(l2)
-    return all(d in it for d in l1)
+    if isinstance(l1, Sized) and isinstance(l2, Sized) and len(l1) > len(l2):
+        return False
+    return _find_unmatched(l1, l2)[0] is None
+
+
+def find_unmatched(l1: Iterable[Any], l2: Iterable[Any]) -> Optional[int]:
+    """Index of the first element of l1 which is not found in l2, after the elements
+    before it were found in order. Returns None if l1 is a subsequence of l2."""
+    return _find_unmatched(l1, l2)[0]
+
+
+def _find_unmatched(l1: Iterable[Any], l2: Iterable[Any]) -> tuple[Optional[int], int]:
+    """Like find_unmatched, and also the position in l2 which the search reached:
+    where the search for the unmatched element started, after the elements of l1
+    before it (or len(l2) when l1 is a subsequence of l2)."""
+    find = getattr(l2, "_find", None)
+    pos = 0
+    if find is None:
+        it = enumerate(l2)
+        for i, d in enumerate(l1):
+            for j, e in it:
+                if e is d or e == d:
+                    pos = j + 1
+                    break
+            else:
+                return i, pos
+        return None, pos
+    for i, d in enumerate(l1):
+        found = find(d, pos)
+        if found < 0:
+            return i, pos
+        pos = found + 1
+    return None, pos
+
+
+# How many of the closest events are shown in the explanation of a failed assertion.
+_CLOSEST_MATCHES = 3
+
+# Events in explanations are shown with their repr truncated to this many characters.
+_MAX_REPR = 240
+
+
+def _short_repr(obj: Any) -> str:
+    r = repr(obj)
+    if len(r) > _MAX_REPR:
+        r = r[: _MAX_REPR - 3] + "..."
+    return r
+
+
+def _describe(obj: Any) -> str:
+    """Summary of one side of a comparison, without the repr of all its events."""
+    if isinstance(obj, (EventList, _EventSequence)):
+        return f"<{type(obj).__name__} of {len(obj)} events>"
+    return f"<{type(obj).__name__} of {len(obj)} expected events>"
+
+
+def _scores(
+    events: Union[EventList, _EventSequence], matcher: EventMatcher, start: int
+) -> Iterable[tuple[int, int]]:
+    """(number of checks passed, position) of the events from start which pass any
+    of the matcher's checks. With an index, only the indexable checks count."""
+    if isinstance(events, EventList) and len(events) >= _INDEX_THRESHOLD:
+        index = events._indexed()
+        counts: collections.Counter[int] = collections.Counter()
+        for k, v in matcher._index_context.items():
+            positions = index.pairs.get((k, v), [])
+            counts.update(positions[bisect.bisect_left(positions, start) :])
+        return ((n, i) for i, n in counts.items())
+    n = len(matcher._checks)
+    scored = (
+        (n - len(matcher._failures(e)), i)
+        for i, e in enumerate(itertools.islice(events, start, None), start)
+    )
+    return (pair for pair in scored if pair[0])
+
+
+def _explain_missing(
+    events: Union[EventList, _EventSequence],
+    target: Union[Mapping[Any, Any], EventMatcher],
+    start: int = 0,
+) -> list[str]:
+    """Lines describing the events closest to target (by the number of key/value
+    pairs they share), at most _CLOSEST_MATCHES of them. Only the events from start
+    are considered, unless none of them share any pair with target."""
+    if isinstance(target, EventMatcher):
+        matcher = target
+    else:
+        matcher = EventMatcher._of(target.items())
+    best = heapq.nsmallest(
+        _CLOSEST_MATCHES, _scores(events, matcher, start), key=lambda p: (-p[0], p[1])
+    )
+    lines = ["closest captured events:"]
+    if not best and start:
+        best = heapq.nsmallest(
+            _CLOSEST_MATCHES, _scores(events, matcher, 0), key=lambda p: (-p[0], p[1])
+        )
+        lines = [f"closest captured events (none after event {start - 1}):"]
+    if not best:
+        return [
+            f"no captured event shares any key/value pair with {_short_repr(target)}"
+        ]
+    for _, i in sorted(best, key=lambda p: (-p[0], p[1])):
+        event_dict = events[i]
+        diffs = [
+            f"{k!r}: {_short_repr(event_dict.get(k, '<missing>'))} != {_short_repr(v)}"
+            for k, v in matcher._failures(event_dict)
+        ]
+        lines.append(f"  event {i}: {_short_repr(event_dict)}")
+        lines.append(f"    differs by {', '.join(diffs)}")
+    return lines
+
+
+def _explain_subseq(
+    expected: Sequence[Any], events: Union[EventList, _EventSequence]
+) -> list[str]:
+    """Explanation of why expected is not a subsequence of events."""
+    n, start = _find_unmatched(expected, events)
+    if n is None:
+        return [f"all {len(expected)} expected events were found in order"]
+    where = f"after event {start - 1}" if start else "anywhere"
+    lines = [
+        f"expected event {n} was not found {where} (of {len(events)} captured):",
+        f"  {_short_repr(expected[n])}",
+    ]
+    earlier = _position(events, expected[n]) if start else -1
+    if earlier >= 0:
+        lines.append(
+            f"it was found at event {earlier}, before event {start - 1} which "
+            f"matched expected event {n - 1}"
+        )
+    elif isinstance(expected[n], (Mapping, EventMatcher)):
+        lines += _explain_missing(events, expected[n], start)
+    return lines
+
+
+def _position(events: Iterable[Any], item: Any) -> int:
+    """Position of the first event equal to item, or -1."""
+    find = getattr(events, "_find", None)
+    if find is not None:
+        return int(find(item, 0))
+    for i, event_dict in enumerate(events):
+        if event_dict is item or event_dict == item:
+            return i
+    return -1
+
+
+def _explain_eq(left: Sequence[Any], right: Sequence[Any]) -> list[str]:
+    """Explanation of the first difference between two sequences of events."""
+    for i, (a, b) in enumerate(zip(left, right)):
+        if a != b:
+            lines = [
+                f"first difference at event {i}:",
+                f"  {_short_repr(a)}",
+                f"  != {_short_repr(b)}",
+            ]
+            if isinstance(a, Mapping) and isinstance(b, Mapping):
+                keys = [k for k in {**a, **b} if a.get(k, _absent) != b.get(k, _absent)]
+                lines.append(f"  differing keys: {', '.join(map(repr, keys))}")
+            break
+    else:
+        lines = []
+    if len(left) != len(right):
+        lines.append(f"left has {len(left)} events, right has {len(right)}")
+    return lines
+
+
+# Logger method names which the chain may end with, once the capture is done.
+_CAPTURE_METHODS = frozenset(
+    {
+        "debug",
+        "info",
+        "warning",
+        "warn",
+        "error",
+        "exception",
+        "critical",
+        "fatal",
+        "msg",
+        "log",
+        "err",
+        "failure",
+    }
+)
+
+# Returned by the capture processor to end the chain without calling a real logger.
+_CAPTURED: tuple[tuple[Any, ...], dict[str, Any]] = ((), {})
+
+
+class _CaptureLogger:
+    """Wraps the loggers made by the configured logger factory while the log fixture
+    is active. The capture processor ends the chain by returning to this logger, which
+    is much cheaper than raising structlog.DropEvent for every event. Any other
+    attribute access is delegated to the wrapped logger, and isinstance checks (e.g.
+    in kept processors) see the wrapped logger's class."""
+
+    __slots__ = ("_logger",)
+
+    def __init__(self, logger: WrappedLogger) -> None:
+        self._logger = logger
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type:
+        return type(self._logger)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._logger, name)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self._logger!r}>"
+
+    def _discard(self, *args: Any, **kwargs: Any) -> None:
+        """The event was already captured, nothing to do here."""
+
+    debug = info = warning = warn = error = exception = _discard
+    critical = fatal = msg = log = err = failure = _discard
+
+
+class _CaptureLoggerFactory:
+    """Logger factory wrapping the original logger factory's loggers."""
+
+    def __init__(self, logger_factory: Callable[..., WrappedLogger]) -> None:
+        self.logger_factory = logger_factory
+
+    def __call__(self, *args: Any) -> _CaptureLogger:
+        return _CaptureLogger(self.logger_factory(*args))
+
+
+def _is_task(obj: Any) -> bool:
+    # no need to import asyncio to find out, if nothing else has
+    asyncio = sys.modules.get("asyncio")
+    return asyncio is not None and isinstance(obj, asyncio.Task)
+
+
+def _current_task() -> Optional[asyncio.Task[Any]]:
+    """The asyncio task running in this thread, if any."""
+    import asyncio
+
+    try:
+        return asyncio.current_task()
+    except RuntimeError:
+        # no event loop running in this thread
+        return None
+
+
+class EventQuery:
+    """A lazily evaluated view of the captured events which match all of the given
+    context. Nothing is computed until one of the methods is called, each of which
+    makes a single pass over the candidate events (narrowed down by the event list's
+    index, when it has one), so the view also reflects events logged after it was
+    created. Returned by ``log.where(...)``, and refined by chaining ``where``."""
+
+    __slots__ = ("_capture", "_events", "_pairs", "_matchers")
+
+    def __init__(
+        self,
+        capture: _EventAssertions,
+        events: Union[EventList, _EventSequence],
+        pairs: tuple[tuple[Any, Any], ...],
+        matchers: tuple[EventMatcher, ...] = (),
+    ) -> None:
+        self._capture = capture
+        self._events = events
+        self._pairs = pairs
+        self._matchers = matchers
+
+    def where(
+        self, matcher: Optional[EventMatcher] = None, /, **context: Any
+    ) -> EventQuery:
+        """A narrower view, of the events which also match the given context (and
+        matcher, if given)."""
+        matchers = self._matchers if matcher is None else (*self._matchers, matcher)
+        pairs = self._pairs + _pairs(context)
+        return EventQuery(self._capture, self._events, pairs, matchers)
+
+    def _matches(self) -> Iterator[EventDict]:
+        checks = [EventMatcher._of(self._pairs), *self._matchers]
+        # any of the pairs narrows down the candidates, since all of them must match
+        context: dict[Any, Any] = {}
+        for matcher in checks:
+            context.update(matcher._index_context)
+        for event_dict in self._events._candidates(context):
+            if all(matcher(event_dict) for matcher in checks):
+                yield event_dict
+
+    def __iter__(self) -> Iterator[EventDict]:
+        self._capture._warn_if_truncated()
+        return self._matches()
+
+    def count(self) -> int:
+        """The number of matching events."""
+        self._capture._warn_if_truncated()
+        return sum(1 for _ in self._matches())
+
+    def exists(self) -> bool:
+        """Whether any event matches. Stops at the first match."""
+        result = next(self._matches(), None) is not None
+        if not result:
+            self._capture._warn_if_truncated()
+        return result
+
+    def first(self) -> Optional[EventDict]:
+        """The earliest matching event, or None if there isn't one."""
+        result = next(self._matches(), None)
+        if result is None:
+            self._capture._warn_if_truncated()
+        return result
+
+    def values(self, key: Any) -> list[Any]:
+        """The values of key in the matching events, in order. Matching events which
+        don't have the key are skipped."""
+        self._capture._warn_if_truncated()
+        return [e[key] for e in self._matches() if key in e]
+
+    def __repr__(self) -> str:
+        args = [repr(matcher) for matcher in self._matchers]
+        args += [f"{k}={v!r}" for k, v in self._pairs]
+        return f"<EventQuery where({', '.join(args)})>"
+
+
+def _check_no_context(context: dict[str, Any]) -> None:
+    if context:
+        raise TypeError(
+            "context can not be combined with a matcher, include it in the matcher"
+        )
+
+
+def _pairs(context: dict[str, Any]) -> tuple[tuple[Any, Any], ...]:
+    """Query context as pairs, with the level as it appears in captured events."""
+    _normalize_level(context)
+    return tuple(context.items())
+
+
+class _EventAssertions:
+    """The assertion helpers, for anything with captured events: the capture, and
+    views of part of its events (see ``log.since``)."""
+
+    events: Union[EventList, _EventSequence]
+
+    def _source(self, context: dict[str, Any]) -> Union[EventList, _EventSequence]:
+        raise NotImplementedError  # pragma: no cover
+
+    def _warn_if_truncated(self) -> None:
+        raise NotImplementedError  # pragma: no cover
+
+    def has(self, message: Union[str, EventMatcher], **context: Any) -> bool:
+        """Returns whether the event message has been logged, with optional
+        subcontext. Usage in test code would be with an assertion, e.g.:
+
+            assert log.has("foo")
+            assert log.has("bar", k1="v1", k2="v2")
+
+        The message may instead be a matcher from ``log.matcher``. With task
+        tracking enabled, passing an asyncio task as ``task=`` only considers the
+        events logged by that task.
+        """
+        events = self._source(context)
+        if isinstance(message, EventMatcher):
+            _check_no_context(context)
+            candidates = events._candidates(message._index_context)
+            result = any(map(message, candidates))
+        else:
+            context["event"] = message
+            _normalize_level(context)
+            candidates = events._candidates(context)
+            result = any(is_submap(context, e) for e in candidates)
+        if not result:
+            self._warn_if_truncated()
+        return result
 
+    def count(self, message: Union[str, EventMatcher], **context: Any) -> int:
+        """Returns the number of messages logged, with optional
+        subcontext. Usage in test code would be with an assertion, e.g.:
+
+            assert log.count("foo") == 2
+            assert log.count("bar", k1="v1", k2="v2") == 1
+
+        The message may instead be a matcher from ``log.matcher``. With task
+        tracking enabled, passing an asyncio task as ``task=`` only counts the
+        events logged by that task.
+        """
+        events = self._source(context)
+        self._warn_if_truncated()
+        if isinstance(message, EventMatcher):
+            _check_no_context(context)
+            return sum(map(message, events._candidates(message._index_context)))
+        context["event"] = message
+        _normalize_level(context)
+        return sum(is_submap(context, e) for e in events._candidates(context))
+
+    def matcher(self, event: Any, **context: Any) -> EventMatcher:
+        """Compiles a reusable predicate matching events with the given event name
+        and subcontext, for use in place of repeating the same arguments, e.g.:
+
+            started = log.matcher("started", pid=lambda pid: pid > 0)
+            assert log.has(started)
+            assert log.count(started) == 2
+            assert log.where(started, level="info").exists()
+            assert log.events >= [started, log.matcher(re.compile("^stopp"))]
+
+        Besides plain values, which must be equal, values may be compiled regular
+        expressions (searched for in the event's value), functions (called with the
+        event's value), or anything comparing equal, e.g. ``pytest.approx``.
+        """
+        return EventMatcher(event, **context)
+
+    def where(
+        self, matcher: Optional[EventMatcher] = None, /, **context: Any
+    ) -> EventQuery:
+        """A lazily evaluated view of the events matching the given context, for
+        compound queries which need only one pass over the events, e.g.:
+
+            assert log.where(event="foo", level="info").count() == 2
+            assert log.where(event="bar").where(k1="v1").values("k2") == ["v2"]
+
+        The view has the methods ``count()``, ``exists()``, ``first()`` and
+        ``values(key)``, and can be iterated. A matcher from ``log.matcher`` may be
+        given too. With task tracking enabled, passing an asyncio task as ``task=``
+        only considers the events logged by that task.
+        """
+        events = self._source(context)
+        matchers = () if matcher is None else (matcher,)
+        return EventQuery(self, events, _pairs(context), matchers)
+
+    def assert_has(self, message: Union[str, EventMatcher], **context: Any) -> None:
+        """Like ``assert log.has(message, **context)``, but on failure the error
+        explains which captured events came closest to matching."""
+        __tracebackhide__ = True
+        if self.has(message, **context):
+            return
+        events = self._source(context)
+        target: Union[dict[str, Any], EventMatcher]
+        if isinstance(message, EventMatcher):
+            target = message
+        else:
+            context["event"] = message
+            _normalize_level(context)
+            target = context
+        lines = [f"event not found: {_short_repr(target)}"]
+        lines += _explain_missing(events, target)
+        raise AssertionError("\n".join(lines))
+
+    def assert_subsequence(self, expected: Sequence[EventDict]) -> None:
+        """Like ``assert log.events >= expected``, but on failure the error explains
+        which expected event was not found, and the captured events closest to it."""
+        __tracebackhide__ = True
+        if self.events >= expected:
+            return
+        self._warn_if_truncated()
+        raise AssertionError("\n".join(_explain_subseq(expected, self.events)))
+
+
+class Checkpoint:
+    """A position in the events of a capture, made by ``log.checkpoint()``."""
+
+    __slots__ = ("events", "offset")
+
+    def __init__(self, events: Union[EventList, _EventSequence]) -> None:
+        self.events = events
+        # counting the events dropped by a bounded capture, so it stays valid
+        self.offset: int = len(events) + getattr(events, "dropped", 0)
+
+    def __repr__(self) -> str:
+        return f"<Checkpoint at event {self.offset}>"
+
+
+class EventsSince(_EventSequence):
+    """Read-only view of the events of a capture which were logged after a
+    checkpoint. Events logged later are included as they arrive."""
+
+    def __init__(self, checkpoint: Checkpoint) -> None:
+        self._events = checkpoint.events
+        self._offset = checkpoint.offset
+
+    @property
+    def _start(self) -> int:
+        """Position of the first event after the checkpoint in the whole capture."""
+        return max(self._offset - getattr(self._events, "dropped", 0), 0)
+
+    def append(self, event_dict: EventDict) -> None:
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    clear = append  # type: ignore[assignment]
+
+    def _get(self, i: int) -> EventDict:
+        return self._events[self._start + i]
+
+    def __len__(self) -> int:
+        return max(len(self._events) - self._start, 0)
 
-class StructuredLogCapture:
+    def __iter__(self) -> Iterator[EventDict]:
+        events = self._events
+        if isinstance(events, EventList):
+            return map(events.__getitem__, range(self._start, len(events)))
+        return events._iter_from(self._start)
+
+    def _candidates(self, context: Mapping[Any, Any]) -> Iterable[EventDict]:
+        if isinstance(self._events, EventList):
+            return self._events._candidates(context, self._start)
+        return self
+
+    def _find(self, item: Any, start: int) -> int:
+        offset = self._start
+        if not isinstance(self._events, EventList):
+            events = self._events._iter_from(offset + start)
+            for i, event_dict in enumerate(events, start):
+                if event_dict == item:
+                    return i
+            return -1
+        pos = self._events._find(item, offset + start)
+        return pos - offset if pos >= 0 else -1
+
+
+class CaptureSince(_EventAssertions):
+    """The events captured since a checkpoint, made by ``log.since(checkpoint)``,
+    with the same assertion helpers as the capture itself."""
+
+    def __init__(self, capture: StructuredLogCapture, checkpoint: Checkpoint) -> None:
+        self.capture = capture
+        self.checkpoint = checkpoint
+        self.events = EventsSince(checkpoint)
+
+    def _source(self, context: dict[str, Any]) -> Union[EventList, _EventSequence]:
+        if _is_task(context.get("task")):
+            raise TypeError("task= is not supported for the events since a checkpoint")
+        return self.events
+
+    def _warn_if_truncated(self) -> None:
+        dropped = getattr(self.checkpoint.events, "dropped", 0)
+        if dropped > self.checkpoint.offset:
+            n = dropped - self.checkpoint.offset
+            msg = f"{n} events logged since the checkpoint were dropped"
+            warnings.warn(TruncatedCaptureWarning(msg), stacklevel=3)
+
+
+# How the capture stores each event dict: the event dict itself, a shallow copy
+# (safe from later changes to the dict, but not to the values in it), or frozen.
+_COPY_POLICIES: dict[str, Optional[Callable[[EventDict], EventDict]]] = {
+    "reference": None,
+    "shallow": dict,
+    "frozen": FrozenEvent,
+}
+
+
+def _resolve(future: asyncio.Future[EventDict], event_dict: EventDict) -> None:
+    if not future.done():
+        future.set_result(event_dict)
+
+
+class _Waiter:
+    """A matcher registered by ``log.wait_for`` or ``log.await_event``, which the
+    capture checks each new event against until one matches."""
+
+    __slots__ = ("matcher", "event", "future", "thread")
+
+    def __init__(
+        self, matcher: EventMatcher, future: Optional[asyncio.Future[EventDict]] = None
+    ) -> None:
+        self.matcher = matcher
+        self.event: Optional[EventDict] = None
+        self.future = future
+        self.thread = threading.get_ident()
+
+    def set(self, event_dict: EventDict) -> None:
+        self.event = event_dict
+        future = self.future
+        if future is None:
+            return
+        if threading.get_ident() == self.thread:
+            _resolve(future, event_dict)
+            return
+        try:
+            future.get_loop().call_soon_threadsafe(_resolve, future, event_dict)
+        except RuntimeError:
+            pass  # the event loop was closed, nothing is waiting anymore
+
+
+class StructuredLogCapture(_EventAssertions):
     """Processor which accumulates log events during testing. The log fixture
     provided by pytest_structlog is an instance of this class."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_events: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        storage: str = "list",
+        track_tasks: bool = False,
+        copy: str = "reference",
+    ) -> None:
+        if storage not in _STORAGE_CHOICES:
+            choices = ", ".join(map(repr, _STORAGE_CHOICES))
+            raise ValueError(f"storage must be one of {choices} (got: {storage!r})")
+        if storage != "list" and (max_events is not None or max_bytes is not None):
+            raise ValueError(f"{storage} storage does not support max_events/max_bytes")
+        if storage == "count" and track_tasks:
+            raise ValueError("count storage does not support track_tasks")
+        if copy not in _COPY_POLICIES:
+            choices = ", ".join(map(repr, _COPY_POLICIES))
+            raise ValueError(f"copy must be one of {choices} (got: {copy!r})")
+        if copy != "reference" and storage in ("compact", "spill", "count"):
+            raise ValueError(f"{storage} storage does not support copy={copy!r}")
         self.original_configure: Callable = structlog.configure
         self.original_config: dict[str, Any] = structlog.get_config()
         self.configure_once: Callable = structlog.configure_once
-        self.events: EventList = EventList()
-        self._add_log_level = settings.use_processor("add_log_level")[0]
+        self.max_events = max_events
+        self.max_bytes = max_bytes
+        self.storage = storage
+        self.copy = copy
+        self._copy = _COPY_POLICIES[copy]
+        self.events: Union[EventList, _EventSequence] = self._new_events()
+        self._tasks: Optional[dict[asyncio.Task[Any], EventList]]
+        self._tasks = {} if track_tasks else None
+        # processor name -> [calls, seconds], when running with --structlog-profile
+        self._profile: dict[str, list[float]] = {}
+        # the current test, set by the log fixtures
+        self._node: Optional[pytest.Item] = None
+        # names of the processors kept in the chain, set when installed
+        self._kept: tuple[str, ...] = ()
+        self._receiver: Optional[_EventReceiver] = None
+        # waiting for events, see wait_for and await_event
+        self._waiters: list[_Waiter] = []
+        self._condition = threading.Condition()
+        # the level is only wanted on events which are kept
+        self._add_log_level = (
+            storage != "count" and settings.use_processor("add_log_level")[0]
+        )
+
+    def _new_events(self) -> Union[EventList, _EventSequence]:
+        """An empty event storage, of the kind this capture was configured for."""
+        if self.storage != "list":
+            return _STORAGE[self.storage]()
+        if self.max_events is None and self.max_bytes is None:
+            return EventList()
+        return BoundedEventList(self.max_events, self.max_bytes)
+
+    def _renew(self) -> None:
+        """Start over with no captured events, for reuse of the capture by another
+        test."""
+        self.events = self._new_events()
+        if self._tasks is not None:
+            self._tasks = {}
+        self._profile = {}
+
+    def _stop_receiving(self) -> None:
+        if self._receiver is not None:
+            self._receiver.close()
+            self._receiver = None
 
     def _reset(self) -> None:
         self.original_configure(**self.original_config)
@@ -80,32 +1492,232 @@ class StructuredLogCapture:
 
     def __call__(
         self, logger: WrappedLogger, method_name: str, event_dict: EventDict
-    ) -> NoReturn:
-        """Captures a logging event, appending it as a dict in the event list."""
+    ) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        """Captures a logging event, appending it as a dict in the event list.
+        The event goes no further: the chain either ends at the capture logger,
+        or, for loggers not made by the log fixture's logger factory, is dropped."""
         if self._add_log_level:
             structlog.stdlib.add_log_level(logger, method_name, event_dict)
+        if self._copy is not None:
+            event_dict = self._copy(event_dict)
         self.events.append(event_dict)
+        if self._tasks is not None:
+            task = _current_task()
+            if task is not None:
+                try:
+                    self._tasks[task].append(event_dict)
+                except KeyError:
+                    self._tasks[task] = EventList([event_dict])
+        if self._waiters:
+            self._notify(event_dict)
+        if type(logger) is _CaptureLogger and method_name in _CAPTURE_METHODS:
+            return _CAPTURED
         raise structlog.DropEvent
 
-    def has(self, message: str, **context: Any) -> bool:
-        """Returns whether the event message has been logged, with optional
-        subcontext. Usage in test code would be with an assertion, e.g.:
+    def assert_matches_snapshot(
+        self, name: Optional[str] = None, ignore: Iterable[str] = ()
+    ) -> None:
+        """Asserts that the captured events are the same as in the test's snapshot
+        file, ignoring the given event keys (and those of the structlog_snapshot_ignore
+        ini option). The snapshot is written by the first run, or when running with
+        --structlog-snapshot-update. Pass a name to use several snapshots in one test.
 
-            assert log.has("foo")
-            assert log.has("bar", k1="v1", k2="v2")
+        Events are compared as JSON, in order, stopping at the first difference.
         """
-        context["event"] = message
-        return any(is_submap(context, e) for e in self.events)
+        __tracebackhide__ = True
+        if self._node is None:
+            raise RuntimeError("snapshots are only available from the log fixtures")
+        path = _snapshot_path(self._node, name)
+        ignored = settings.snapshot_ignore.union(ignore)
+        actual = [_snapshot_line(e, ignored) for e in self.events]
+        if settings.snapshot_update or not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.writelines(line + "\n" for line in actual)
+            return
+        with open(path, encoding="utf-8") as f:
+            expected = f.read().splitlines()
+        i = _snapshot_divergence(expected, actual, ignored)
+        if i is not None:
+            raise AssertionError(_snapshot_mismatch(path, expected, actual, i, ignored))
 
-    def count(self, message: str, **context: Any) -> int:
-        """Returns the number of messages logged, with optional
-        subcontext. Usage in test code would be with an assertion, e.g.:
+    def checkpoint(self) -> Checkpoint:
+        """Marks the current position in the captured events, for assertions on
+        only the events logged afterwards with ``log.since``."""
+        return Checkpoint(self.events)
 
-            assert log.count("foo") == 2
-            assert log.count("bar", k1="v1", k2="v2") == 1
+    def since(self, checkpoint: Checkpoint) -> CaptureSince:
+        """The events logged after the checkpoint, with the assertion helpers of the
+        capture (``has``, ``count``, ``where``, etc.), and comparisons of ``events``
+        like ``log.events``. Assertions only look at the events after the
+        checkpoint, so asserting step by step doesn't rescan earlier events, e.g.:
+
+            step = log.checkpoint()
+            do_step()
+            assert log.since(step).has("step done")
+            assert log.since(step).events >= [log.info("a"), log.info("b")]
+        """
+        if checkpoint.events is not self.events:
+            raise ValueError("the checkpoint was made in another test")
+        return CaptureSince(self, checkpoint)
+
+    def forwarder(self, batch_size: int = 100) -> EventForwarder:
+        """Starts receiving the events logged by other processes, and returns the
+        forwarder which those processes must call first, e.g. as the initializer of
+        a process pool:
+
+            with ProcessPoolExecutor(initializer=log.forwarder()) as pool:
+                pool.map(work, items)
+            log.drain()
+            assert log.has("worked")
+
+        Events are sent in batches of batch_size, with the rest sent when the process
+        exits. Call ``log.drain()`` before looking at the events, to wait for all the
+        events sent so far to be received.
+        """
+        if self._receiver is None:
+            self._receiver = _EventReceiver(self)
+        receiver = self._receiver
+        return EventForwarder(
+            receiver.family,
+            receiver.address,
+            receiver.token.decode(),
+            self._kept,
+            self._add_log_level,
+            batch_size,
+        )
+
+    def drain(self, timeout: float = 5.0) -> None:
+        """Waits until the events which other processes have sent so far (see
+        ``log.forwarder``) have been received, raising TimeoutError if that takes
+        longer than timeout seconds."""
+        if self._receiver is not None:
+            self._receiver.drain(timeout)
+
+    def wait_for(
+        self,
+        message: Union[str, EventMatcher],
+        /,
+        timeout: float = 5.0,
+        **context: Any,
+    ) -> EventDict:
+        """Waits until an event matching the message and subcontext has been logged,
+        e.g. by a background thread, and returns it:
+
+            worker.start()
+            event = log.wait_for("job done", timeout=2, job_id=1)
+
+        An event logged before the call also counts. The message may instead be a
+        matcher from ``log.matcher``. The capture checks each new event as it is
+        logged, so nothing is rescanned while waiting. Raises TimeoutError if no
+        matching event is logged within timeout seconds.
+        """
+        waiter = _Waiter(self._wait_matcher(message, context))
+        with self._condition:
+            self._waiters.append(waiter)
+            try:
+                event = self._first_match(waiter.matcher)
+                if event is not None:
+                    return event
+                if not self._condition.wait_for(
+                    lambda: waiter.event is not None, timeout
+                ):
+                    raise self._timeout(message, context, timeout)
+            finally:
+                self._waiters.remove(waiter)
+        assert waiter.event is not None
+        return waiter.event
+
+    async def await_event(
+        self,
+        message: Union[str, EventMatcher],
+        /,
+        timeout: float = 5.0,
+        **context: Any,
+    ) -> EventDict:
+        """The asyncio counterpart of ``log.wait_for``, which doesn't block the
+        event loop while waiting:
+
+            asyncio.create_task(worker())
+            event = await log.await_event("job done", job_id=1)
         """
+        import asyncio
+
+        future = asyncio.get_running_loop().create_future()
+        waiter = _Waiter(self._wait_matcher(message, context), future)
+        with self._condition:
+            self._waiters.append(waiter)
+            event = self._first_match(waiter.matcher)
+        try:
+            if event is not None:
+                return event
+            try:
+                return await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                raise self._timeout(message, context, timeout) from None
+        finally:
+            with self._condition:
+                self._waiters.remove(waiter)
+
+    def _wait_matcher(
+        self, message: Union[str, EventMatcher], context: dict[str, Any]
+    ) -> EventMatcher:
+        if isinstance(message, EventMatcher):
+            _check_no_context(context)
+            return message
         context["event"] = message
-        return sum(is_submap(context, e) for e in self.events)
+        _normalize_level(context)
+        return EventMatcher._of(context.items())
+
+    def _first_match(self, matcher: EventMatcher) -> Optional[EventDict]:
+        """The first captured event matching, if any are kept to look through."""
+        if self.storage == "count":
+            return None
+        candidates = self.events._candidates(matcher._index_context)
+        return next(filter(matcher, candidates), None)
+
+    def _notify(self, event_dict: EventDict) -> None:
+        with self._condition:
+            matched = False
+            for waiter in self._waiters:
+                if waiter.event is None and waiter.matcher(event_dict):
+                    waiter.set(event_dict)
+                    matched = True
+            if matched:
+                self._condition.notify_all()
+
+    def _timeout(
+        self,
+        message: Union[str, EventMatcher],
+        context: dict[str, Any],
+        timeout: float,
+    ) -> TimeoutError:
+        target = message if isinstance(message, EventMatcher) else context
+        lines = [f"no event {_short_repr(target)} was logged within {timeout}s"]
+        if self.storage != "count":
+            lines += _explain_missing(self.events, target)
+        return TimeoutError("\n".join(lines))
+
+    def events_for(self, task: asyncio.Task[Any]) -> EventList:
+        """The events logged from within the given asyncio task. Requires the capture
+        to track tasks, e.g. with ``@pytest.mark.structlog(track_tasks=True)``."""
+        if self._tasks is None:
+            raise RuntimeError(
+                "asyncio task tracking is not enabled for this capture, use "
+                "@pytest.mark.structlog(track_tasks=True) or structlog_track_tasks"
+            )
+        return self._tasks.get(task, EventList())
+
+    def _source(self, context: dict[str, Any]) -> Union[EventList, _EventSequence]:
+        if _is_task(context.get("task")):
+            return self.events_for(context.pop("task"))
+        return self.events
+
+    def _warn_if_truncated(self) -> None:
+        dropped = getattr(self.events, "dropped", 0)
+        if dropped:
+            msg = f"{dropped} earlier events were dropped from the bounded capture"
+            warnings.warn(TruncatedCaptureWarning(msg), stacklevel=3)
 
     def log(self, level: Union[int, str], event: str, **kw: Any) -> dict[str, Any]:
         """Create log event to assert against."""
@@ -132,6 +1744,67 @@ class StructuredLogCapture:
         return self.log(logging.CRITICAL, event, **kw)
 
 
+def _snapshot_path(node: pytest.Item, name: Optional[str]) -> str:
+    """Snapshot file of a test: __snapshots__/<module>/<test>.jsonl, next to the test
+    module."""
+    if name is None:
+        name = node.nodeid.partition("::")[2] or node.name
+    directory, filename = os.path.split(str(node.path))
+    module = os.path.splitext(filename)[0]
+    safe_name = re.sub(r"[^\w.\-]+", "_", name)
+    return os.path.join(directory, "__snapshots__", module, f"{safe_name}.jsonl")
+
+
+def _snapshot_line(event_dict: EventDict, ignored: frozenset[str]) -> str:
+    """Canonical JSON form of an event, as stored in snapshot files."""
+    if ignored:
+        event_dict = {k: v for k, v in event_dict.items() if k not in ignored}
+    return json.dumps(event_dict, sort_keys=True, default=repr)
+
+
+def _snapshot_divergence(
+    expected: list[str], actual: list[str], ignored: frozenset[str]
+) -> Optional[int]:
+    """Position of the first event which differs between the snapshot and the
+    capture, or None if they're the same."""
+    for i, (e, a) in enumerate(zip(expected, actual)):
+        # the stored line may have keys which have been ignored since it was written
+        if e != a and (not ignored or _snapshot_line(json.loads(e), ignored) != a):
+            return i
+    if len(expected) != len(actual):
+        return min(len(expected), len(actual))
+    return None
+
+
+def _snapshot_mismatch(
+    path: str, expected: list[str], actual: list[str], i: int, ignored: frozenset[str]
+) -> str:
+    lines = [
+        f"captured events differ from snapshot {path} at event {i}:",
+        f"  expected: {expected[i] if i < len(expected) else '<no more events>'}",
+        f"  actual:   {actual[i] if i < len(actual) else '<no more events>'}",
+    ]
+    if i < len(expected) and i < len(actual):
+        e, a = json.loads(expected[i]), json.loads(actual[i])
+        diffs = [
+            f"{k!r} ({e.get(k, '<missing>')!r} != {a.get(k, '<missing>')!r})"
+            for k in sorted(e.keys() | a.keys())
+            if k not in ignored and e.get(k, _absent) != a.get(k, _absent)
+        ]
+        lines.append(f"  differing keys: {', '.join(diffs)}")
+    lines.append(
+        f"({len(expected)} events in snapshot, {len(actual)} captured; "
+        f"rerun with --structlog-snapshot-update to accept the captured events)"
+    )
+    return "\n".join(lines)
+
+
+# structlog.configure itself, for reconfiguring structlog in forwarding processes,
+# where structlog.configure may be the stub inherited from a capturing process. It
+# is recorded when a capture is first installed.
+_original_configure: Optional[Callable[..., None]] = None
+
+
 def no_op(*args: Any, **kwargs: Any) -> None:
     """Function used to stub out the original structlog.configure method."""
     pass
@@ -174,9 +1847,33 @@ class Settings:
             },
         }
         self.report: str = "auto"
+        self.report_section: str = "auto"
+        self.max_events: Optional[int] = None
+        self.max_bytes: Optional[int] = None
+        self.storage: str = "list"
+        self.track_tasks: bool = False
+        self.copy: str = "reference"
+        self.summary: int = 0
+        self.profile: int = 0
+        self.snapshot_update: bool = False
+        self.snapshot_ignore: frozenset[str] = frozenset()
+        self._decisions: dict[str, tuple[bool, str]] = {}
+        self._filtered: Optional[tuple[Any, tuple[Any, ...], list[Any]]] = None
+
+    def invalidate(self) -> None:
+        """Forget memoized decisions, must be called after changing the settings."""
+        self._decisions.clear()
+        self._filtered = None
 
     def use_processor(self, name: str) -> tuple[bool, str]:
         """Should processor be used during test, according to plugin configuration?"""
+        try:
+            return self._decisions[name]
+        except KeyError:
+            result = self._decisions[name] = self._use_processor(name)
+            return result
+
+    def _use_processor(self, name: str) -> tuple[bool, str]:
         if self.mode == "evict":
             for reason, processor_names in self.evict.items():
                 if name in processor_names:
@@ -189,6 +1886,22 @@ class Settings:
                     return True, reason
             return False, ""
 
+    def filter_processors(self, processors: Sequence[Any]) -> list[Any]:
+        """The processors which should be used during test, out of those configured.
+        The result is cached for as long as the same processor list is configured
+        and has not been modified in place, which is usually the whole session."""
+        cached = self._filtered
+        if (
+            cached is not None
+            and cached[0] is processors
+            and len(cached[1]) == len(processors)
+            and all(a is b for a, b in zip(cached[1], processors))
+        ):
+            return cached[2]
+        result = [p for p in processors if self.use_processor(_name(p))[0]]
+        self._filtered = processors, tuple(processors), result
+        return result
+
     def reset(self) -> None:
         """Resets the state of the plugin to default."""
         self.keep["config-file"].clear()
@@ -197,11 +1910,409 @@ class Settings:
         self.evict["cmdline-arg"].clear()
         self.mode = "keep"
         self.report = "auto"
+        self.report_section = "auto"
+        self.max_events = None
+        self.max_bytes = None
+        self.storage = "list"
+        self.track_tasks = False
+        self.copy = "reference"
+        self.summary = 0
+        self.profile = 0
+        self.snapshot_update = False
+        self.snapshot_ignore = frozenset()
+        self.invalidate()
 
 
 settings: Settings = Settings()
 
 
+class _ProfiledProcessor:
+    """Wraps a processor to accumulate its call count and cumulative time into the
+    profile of the capture's current test, for --structlog-profile."""
+
+    __slots__ = ("processor", "name", "capture")
+
+    def __init__(self, processor: Any, capture: StructuredLogCapture) -> None:
+        self.processor = processor
+        self.name = _name(processor)
+        self.capture = capture
+
+    def __call__(
+        self, logger: WrappedLogger, method_name: str, event_dict: EventDict
+    ) -> Any:
+        start = time.perf_counter()
+        try:
+            return self.processor(logger, method_name, event_dict)
+        finally:
+            elapsed = time.perf_counter() - start
+            stats = self.capture._profile.setdefault(self.name, [0, 0.0])
+            stats[0] += 1
+            stats[1] += elapsed
+
+
+# Frames sent by forwarders: a 4-byte big-endian length, then that many bytes. The
+# first frame of a connection is the token, the others are pickled lists of events.
+_FRAME_HEADER = struct.Struct(">I")
+
+
+def _picklable(event_dict: EventDict) -> EventDict:
+    """The event, with any values which can't be pickled replaced by their repr."""
+    import pickle
+
+    result = {}
+    for k, v in event_dict.items():
+        try:
+            pickle.dumps(v)
+        except Exception:
+            v = repr(v)
+        result[k] = v
+    return result
+
+
+class EventForwarder:
+    """Picklable handle on the receiver of a capture, made by ``log.forwarder()``.
+    Calling it, in another process, reconfigures structlog there to send events to
+    the capture rather than processing them locally. It is meant to be used as the
+    initializer of process pools, e.g.
+    ``ProcessPoolExecutor(initializer=log.forwarder())``."""
+
+    def __init__(
+        self,
+        family: int,
+        address: Any,
+        token: str,
+        kept: tuple[str, ...],
+        add_log_level: bool,
+        batch_size: int,
+    ) -> None:
+        self.family = family
+        self.address = address
+        self.token = token
+        self.kept = kept
+        self.add_log_level = add_log_level
+        self.batch_size = batch_size
+
+    def __call__(self) -> None:
+        import multiprocessing.util
+        import socket
+
+        sock = socket.socket(self.family, socket.SOCK_STREAM)
+        sock.connect(self.address)
+        token = self.token.encode()
+        sock.sendall(_FRAME_HEADER.pack(len(token)) + token)
+        processor = _ForwardingProcessor(self, sock)
+        # the processors of this process which the capture would keep, in case they
+        # were inherited from a test already capturing events (with fork)
+        config = structlog.get_config()
+        processors = []
+        for p in config["processors"]:
+            if isinstance(p, _ProfiledProcessor):
+                p = p.processor
+            if not isinstance(p, StructuredLogCapture) and _name(p) in self.kept:
+                processors.append(p)
+        logger_factory = config["logger_factory"]
+        if not isinstance(logger_factory, _CaptureLoggerFactory):
+            logger_factory = _CaptureLoggerFactory(logger_factory)
+        configure = _original_configure or structlog.configure
+        configure(
+            processors=[*processors, processor],
+            logger_factory=logger_factory,
+            cache_logger_on_first_use=False,
+        )
+        structlog.configure = structlog.configure_once = no_op
+        # multiprocessing children exit without running atexit handlers
+        multiprocessing.util.Finalize(processor, processor.flush, exitpriority=10)
+        atexit.register(processor.flush)
+
+
+class _ForwardingProcessor:
+    """Final processor of the chain in processes forwarding their events to a
+    capture. Events are sent in batches, and whatever remains is sent when the
+    process exits."""
+
+    def __init__(self, forwarder: EventForwarder, sock: socket.socket) -> None:
+        self.add_log_level = forwarder.add_log_level
+        self.batch_size = forwarder.batch_size
+        self.sock: Optional[socket.socket] = sock
+        self.batch: list[EventDict] = []
+        self.lock = threading.Lock()
+
+    def __call__(
+        self, logger: WrappedLogger, method_name: str, event_dict: EventDict
+    ) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        if self.add_log_level:
+            structlog.stdlib.add_log_level(logger, method_name, event_dict)
+        with self.lock:
+            self.batch.append(event_dict)
+            if len(self.batch) >= self.batch_size:
+                self._send()
+        if type(logger) is _CaptureLogger and method_name in _CAPTURE_METHODS:
+            return _CAPTURED
+        raise structlog.DropEvent
+
+    def flush(self) -> None:
+        """Send any events which are waiting for their batch to fill up."""
+        with self.lock:
+            self._send()
+
+    def _send(self) -> None:
+        import pickle
+
+        batch, self.batch = self.batch, []
+        if not batch or self.sock is None:
+            return
+        try:
+            data = pickle.dumps(batch)
+        except Exception:
+            data = pickle.dumps([_picklable(e) for e in batch])
+        try:
+            self.sock.sendall(_FRAME_HEADER.pack(len(data)) + data)
+        except OSError:
+            # the capture is gone, i.e. the test is over: nowhere to send events
+            self.sock = None
+
+
+class _EventReceiver:
+    """Receives the events of forwarders in a background thread, and appends them
+    to the capture's events. Only listens locally: a Unix socket in a private
+    temporary directory where available, otherwise TCP on the loopback interface.
+    Connections must start by sending the token before anything is unpickled."""
+
+    def __init__(self, capture: StructuredLogCapture) -> None:
+        import secrets
+        import selectors
+        import socket
+
+        self.capture = capture
+        self.token = secrets.token_hex(16).encode()
+        self.dir: Optional[str] = None
+        if hasattr(socket, "AF_UNIX"):
+            self.dir = tempfile.mkdtemp(prefix="pytest-structlog-")
+            self.family = socket.AF_UNIX
+            self.address: Any = os.path.join(self.dir, "events.sock")
+            self.listener = socket.socket(self.family, socket.SOCK_STREAM)
+            self.listener.bind(self.address)
+        else:  # pragma: no cover
+            self.family = socket.AF_INET
+            self.listener = socket.socket(self.family, socket.SOCK_STREAM)
+            self.listener.bind(("127.0.0.1", 0))
+            self.address = self.listener.getsockname()
+        self.listener.listen()
+        self.listener.setblocking(False)
+        self.wakeup_r, self.wakeup_w = socket.socketpair()
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.listener, selectors.EVENT_READ)
+        self.selector.register(self.wakeup_r, selectors.EVENT_READ)
+        # received bytes not yet making up a complete frame, and whether the token
+        # was received, by connection
+        self.buffers: dict[socket.socket, bytearray] = {}
+        self.authenticated: set[socket.socket] = set()
+        self.closing = False
+        self.cond = threading.Condition()
+        self.drains_requested = 0
+        self.drains_done = 0
+        self.thread = threading.Thread(
+            target=self._run, name="pytest-structlog-receiver", daemon=True
+        )
+        self.thread.start()
+
+    def _run(self) -> None:
+        while not self.closing:
+            self._handle(self.selector.select())
+            with self.cond:
+                requested = self.drains_requested
+            if requested == self.drains_done:
+                continue
+            # sweep up everything sent so far, including connections not yet
+            # accepted, and complete any partially received frames
+            while not self.closing:
+                partial = any(self.buffers.values())
+                ready = self.selector.select(0.01 if partial else 0)
+                ready = [(k, m) for k, m in ready if k.fileobj is not self.wakeup_r]
+                if not ready and not partial:
+                    break
+                self._handle(ready)
+            with self.cond:
+                self.drains_done = requested
+                self.cond.notify_all()
+
+    def _handle(self, ready: list[tuple[selectors.SelectorKey, int]]) -> None:
+        for key, _ in ready:
+            sock: Any = key.fileobj
+            if sock is self.wakeup_r:
+                self.wakeup_r.recv(4096)
+            elif sock is self.listener:
+                self._accept()
+            else:
+                self._read(sock)
+
+    def _accept(self) -> None:
+        import selectors
+
+        while True:
+            try:
+                conn, _ = self.listener.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            conn.setblocking(False)
+            self.selector.register(conn, selectors.EVENT_READ)
+            self.buffers[conn] = bytearray()
+
+    def _read(self, conn: socket.socket) -> None:
+        import hmac
+        import pickle
+
+        try:
+            data = conn.recv(1 << 16)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._disconnect(conn)
+            return
+        buffer = self.buffers[conn]
+        buffer += data
+        header = _FRAME_HEADER.size
+        while len(buffer) >= header:
+            (n,) = _FRAME_HEADER.unpack_from(buffer)
+            if len(buffer) < header + n:
+                break
+            frame = bytes(buffer[header : header + n])
+            del buffer[: header + n]
+            if conn in self.authenticated:
+                copy = self.capture._copy
+                for event_dict in pickle.loads(frame):
+                    if copy is not None:
+                        event_dict = copy(event_dict)
+                    self.capture.events.append(event_dict)
+                    if self.capture._waiters:
+                        self.capture._notify(event_dict)
+            elif hmac.compare_digest(frame, self.token):
+                self.authenticated.add(conn)
+            else:
+                self._disconnect(conn)
+                return
+
+    def _disconnect(self, conn: socket.socket) -> None:
+        self.selector.unregister(conn)
+        conn.close()
+        del self.buffers[conn]
+        self.authenticated.discard(conn)
+
+    def _wakeup(self) -> None:
+        try:
+            self.wakeup_w.send(b"x")
+        except BlockingIOError:  # pragma: no cover
+            pass  # already woken up
+
+    def drain(self, timeout: float) -> None:
+        with self.cond:
+            self.drains_requested += 1
+            requested = self.drains_requested
+            self._wakeup()
+            if not self.cond.wait_for(lambda: self.drains_done >= requested, timeout):
+                raise TimeoutError(
+                    f"events sent from other processes were not all received within "
+                    f"{timeout} seconds"
+                )
+
+    def close(self) -> None:
+        self.closing = True
+        self._wakeup()
+        self.thread.join()
+        for conn in list(self.buffers):
+            self._disconnect(conn)
+        self.selector.close()
+        self.listener.close()
+        self.wakeup_r.close()
+        self.wakeup_w.close()
+        if self.dir is not None:
+            shutil.rmtree(self.dir, ignore_errors=True)
+
+
+def _new_capture(request: FixtureRequest) -> StructuredLogCapture:
+    """Make a capture with the configured options, which the structlog marker (on
+    the requesting test, class or module) may override."""
+    options: dict[str, Any] = {
+        "max_events": settings.max_events,
+        "max_bytes": settings.max_bytes,
+        "storage": settings.storage,
+        "track_tasks": settings.track_tasks,
+        "copy": settings.copy,
+    }
+    options.update(_marker_options(request.node))
+    return StructuredLogCapture(**options)
+
+
+def _marker_options(node: pytest.Item) -> dict[str, Any]:
+    """The options given by the closest structlog marker of node, if any."""
+    marker = node.get_closest_marker("structlog")
+    return dict(marker.kwargs) if marker is not None else {}
+
+
+def _prepare(capture: StructuredLogCapture) -> dict[str, Any]:
+    """The structlog configuration to capture with: the kept processors from the
+    original configuration, ending with the capture."""
+    orig_processors = capture.original_config.get("processors", [])
+    kept_processors = settings.filter_processors(orig_processors)
+    if capture._add_log_level:
+        # decide once, rather than for every event, whether the capture still needs
+        # to add the level: not if the chain already has an add_log_level processor
+        capture._add_log_level = not any(
+            _name(p) == "add_log_level" for p in kept_processors
+        )
+    capture._kept = tuple(_name(p) for p in kept_processors)
+    new_processors: list[Any] = [*kept_processors, capture]
+    if settings.profile:
+        new_processors = [_ProfiledProcessor(p, capture) for p in new_processors]
+    logger_factory = capture.original_config["logger_factory"]
+    return {
+        "processors": new_processors,
+        "logger_factory": _CaptureLoggerFactory(logger_factory),
+        "cache_logger_on_first_use": False,
+    }
+
+
+def _activate(
+    capture: StructuredLogCapture, config: dict[str, Any], monkeypatch: MonkeyPatch
+) -> None:
+    """Reconfigure structlog to capture with config, and stub out structlog.configure
+    so that code under test can't undo that. capture._reset() restores the structlog
+    configuration as it was before."""
+    global _original_configure
+    if _original_configure is None:
+        _original_configure = structlog.configure
+    # what to restore to may be another capture's configuration, if the test uses
+    # more than one of the log fixtures
+    capture.original_configure = _original_configure
+    capture.original_config = structlog.get_config()
+    capture.configure_once = structlog.configure_once
+    _original_configure(**config)
+    monkeypatch.setattr("structlog.configure", no_op)
+    monkeypatch.setattr("structlog.configure_once", no_op)
+
+
+def _install(capture: StructuredLogCapture, monkeypatch: MonkeyPatch) -> None:
+    """Reconfigure structlog with the testing processors, ending with the capture."""
+    _activate(capture, _prepare(capture), monkeypatch)
+
+
+def _start_test(
+    capture: StructuredLogCapture, request: FixtureRequest
+) -> Generator[StructuredLogCapture, None, None]:
+    request.node.structlog_events = events = capture.events
+    capture._node = request.node
+    if settings.profile:
+        request.node.structlog_profile = capture._profile
+    structlog.contextvars.clear_contextvars()
+    yield capture
+    structlog.contextvars.clear_contextvars()
+    capture._stop_receiving()
+    if isinstance(events, SpillEventList):
+        events.close()
+
+
 @pytest.fixture
 def log(
     monkeypatch: MonkeyPatch, request: FixtureRequest
@@ -212,30 +2323,197 @@ def log(
         ``log.has`` a helper method, return a bool for making simple assertions
 
     Example usage: ``assert log.has("some message", var1="extra context")``
+
+    The capture can be limited to the most recent events with the ``structlog``
+    marker, e.g. ``@pytest.mark.structlog(max_events=1000)``.
     """
-    capture = StructuredLogCapture()
-    orig_processors = capture.original_config.get("processors", [])
-    new_processors = [p for p in orig_processors if settings.use_processor(_name(p))[0]]
-    new_processors.append(capture)
-    structlog.configure(processors=new_processors, cache_logger_on_first_use=False)
-    monkeypatch.setattr("structlog.configure", no_op)
-    monkeypatch.setattr("structlog.configure_once", no_op)
-    request.node.structlog_events = capture.events
-    clear_contextvars()
-    yield capture
-    clear_contextvars()
+    capture = _new_capture(request)
+    _install(capture, monkeypatch)
+    yield from _start_test(capture, request)
+    capture._reset()
+
+
+# a shared capture, its structlog configuration, and the marker options it was made with
+_SharedCapture = Tuple[StructuredLogCapture, Dict[str, Any], Dict[str, Any]]
+
+
+@pytest.fixture(scope="module")
+def _log_module_capture(request: FixtureRequest) -> _SharedCapture:
+    capture = _new_capture(request)
+    return capture, _prepare(capture), _marker_options(request.node)
+
+
+@pytest.fixture(scope="session")
+def _log_session_capture(request: FixtureRequest) -> _SharedCapture:
+    capture = _new_capture(request)
+    return capture, _prepare(capture), _marker_options(request.node)
+
+
+def _shared_test(
+    shared: _SharedCapture, monkeypatch: MonkeyPatch, request: FixtureRequest
+) -> Generator[StructuredLogCapture, None, None]:
+    capture, config, options = shared
+    marker_options = _marker_options(request.node)
+    if marker_options != options:
+        given = ", ".join(f"{k}={v!r}" for k, v in marker_options.items())
+        raise pytest.UsageError(
+            f"@pytest.mark.structlog({given}) on {request.node.nodeid} differs from "
+            f"the marker the shared {request.fixturename} capture was made with, "
+            "and can't apply to it: use the log fixture instead"
+        )
+    capture._renew()
+    _activate(capture, config, monkeypatch)
+    yield from _start_test(capture, request)
     capture._reset()
 
 
+@pytest.fixture
+def log_module(
+    _log_module_capture: _SharedCapture,
+    monkeypatch: MonkeyPatch,
+    request: FixtureRequest,
+) -> Generator[StructuredLogCapture, None, None]:
+    """Like the log fixture, but the capturing processor chain is only worked out
+    once per module. Each test still gets its own, empty, list of events. This is
+    cheaper for modules with many small tests, but any structlog configuration must
+    already be in place before the first test of the module using this fixture."""
+    yield from _shared_test(_log_module_capture, monkeypatch, request)
+
+
+@pytest.fixture
+def log_session(
+    _log_session_capture: _SharedCapture,
+    monkeypatch: MonkeyPatch,
+    request: FixtureRequest,
+) -> Generator[StructuredLogCapture, None, None]:
+    """Like the log fixture, but the capturing processor chain is only worked out
+    once per session. Each test still gets its own, empty, list of events. This is
+    cheaper for suites with many small tests, but any structlog configuration must
+    already be in place before the first test using this fixture."""
+    yield from _shared_test(_log_session_capture, monkeypatch, request)
+
+
+def _want_report_section(item: pytest.Item, failed: bool) -> bool:
+    """Will the structlog report section for this test ever be displayed?"""
+    if settings.report_section == "always":
+        return True
+    if settings.report_section == "never":
+        return False
+    if failed:
+        return True
+    # passing tests only have their report sections shown with -rP or -rA
+    reporter = item.config.pluginmanager.get_plugin("terminalreporter")
+    return reporter is not None and reporter.hasopt("P")
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
-def pytest_runtest_call(item: pytest.Item) -> Generator[None, None, None]:
+def pytest_runtest_call(item: pytest.Item) -> Generator[None, Any, None]:
     """Prints out a section of captured structlog events on test failures."""
-    yield
+    outcome = yield
+    if not _want_report_section(item, failed=outcome.excinfo is not None):
+        return
     events = getattr(item, "structlog_events", [])
-    content = os.linesep.join([str(e) for e in events])
+    if isinstance(events, CountingEventList):
+        content = f"({len(events)} events were counted, but not kept)"
+        item.add_report_section("call", "structlog", content)
+        return
+    lines = [str(e) for e in events]
+    dropped = getattr(events, "dropped", 0)
+    if dropped:
+        lines.insert(0, f"({dropped} earlier events were dropped)")
+    content = os.linesep.join(lines)
     item.add_report_section("call", "structlog", content)
 
 
+def pytest_assertrepr_compare(
+    config: pytest.Config, op: str, left: Any, right: Any
+) -> Optional[list[str]]:
+    """Explains failed comparisons of captured events without dumping all of them:
+    the missing event of a subsequence or membership test, or the first difference
+    for equality."""
+    event_types = (EventList, _EventSequence)
+    if (
+        op == "in"
+        and isinstance(right, event_types)
+        and isinstance(left, (Mapping, EventMatcher))
+    ):
+        return [
+            f"{_short_repr(left)} in {_describe(right)}",
+            *_explain_missing(right, left),
+        ]
+    if op in (">=", ">") and isinstance(left, event_types):
+        expected, events = right, left
+    elif op in ("<=", "<") and isinstance(right, event_types):
+        expected, events = left, right
+    elif op == "==" and (
+        isinstance(left, event_types) or isinstance(right, event_types)
+    ):
+        expected, events = left, right
+        if not isinstance(events, (*event_types, list)):
+            return None
+    else:
+        return None
+    if not isinstance(expected, Sequence):
+        return None
+    summary = f"{_describe(left)} {op} {_describe(right)}"
+    if op == "==":
+        return [summary, *_explain_eq(left, right)]
+    if op in (">", "<") and len(events) <= len(expected):
+        return [summary, "the captured events are not more than the expected events"]
+    return [summary, *_explain_subseq(expected, events)]
+
+
+# Per-test capture statistics, by node id, for the --structlog-summary report. With
+# pytest-xdist, they are computed on the workers and travel back on the test reports.
+_collected_stats: dict[str, dict[str, Any]] = {}
+
+# How many of the most logged event names are kept in the statistics of each test.
+_TOP_EVENTS = 5
+
+
+def _event_stats(events: Iterable[EventDict]) -> dict[str, Any]:
+    """Compact, serializable, statistics about the events captured by a test."""
+    if isinstance(events, CountingEventList):
+        return {"events": len(events), "levels": {}, "top_events": []}
+    levels: collections.Counter[str] = collections.Counter()
+    names: collections.Counter[str] = collections.Counter()
+    for e in events:
+        levels[str(e.get("level"))] += 1
+        names[str(e.get("event"))] += 1
+    return {
+        "events": sum(levels.values()),
+        "levels": dict(levels),
+        "top_events": names.most_common(_TOP_EVENTS),
+    }
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(
+    item: pytest.Item, call: pytest.CallInfo[None]
+) -> Generator[None, Any, None]:
+    """Attaches capture statistics to the call phase report, if they'll be used."""
+    outcome = yield
+    if not (settings.summary or settings.profile) or call.when != "call":
+        return
+    stats = {}
+    events = getattr(item, "structlog_events", None)
+    if settings.summary and events is not None:
+        stats.update(_event_stats(events))
+    profile = getattr(item, "structlog_profile", None)
+    if profile is not None:
+        stats["profile"] = profile
+    if stats:
+        outcome.get_result().structlog_stats = stats
+
+
+def pytest_runtest_logreport(report: pytest.TestReport) -> None:
+    """Collects capture statistics, including from the reports of xdist workers."""
+    stats = getattr(report, "structlog_stats", None)
+    if stats is not None:
+        stats["duration"] = report.duration
+        _collected_stats[report.nodeid] = stats
+
+
 def pytest_addoption(parser: pytest.Parser) -> None:
     """Register argparse-style options and ini-style config values."""
     group = parser.getgroup("pytest-structlog")
@@ -295,6 +2573,104 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         type="string",
         default="auto",
     )
+    report_section_help = (
+        "When to render captured structlog events into the test report. Default "
+        "(auto) renders them for failed tests, and for passed tests only if the "
+        "report would show them (-rP or -rA)."
+    )
+    group.addoption(
+        "--structlog-report-section",
+        help=report_section_help,
+        choices=["always", "never", "auto"],
+    )
+    parser.addini(
+        name="structlog_report_section",
+        help=report_section_help,
+        type="string",
+        default="auto",
+    )
+    group.addoption(
+        "--structlog-summary",
+        type=int,
+        metavar="N",
+        default=0,
+        help="Show the N tests which logged the most events, with event counts by "
+        "level and name (N=0 to disable). Works across pytest-xdist workers.",
+    )
+    group.addoption(
+        "--structlog-profile",
+        type=int,
+        metavar="N",
+        default=0,
+        help="Time the processors used during tests, and show the N most expensive "
+        "processors and the N tests spending the most time in them (N=0 to "
+        "disable). Works across pytest-xdist workers.",
+    )
+    group.addoption(
+        "--structlog-snapshot-update",
+        action="store_true",
+        help="Write the captured events to the snapshot files used by "
+        "log.assert_matches_snapshot(), instead of comparing with them.",
+    )
+    parser.addini(
+        name="structlog_snapshot_ignore",
+        help="Event keys which log.assert_matches_snapshot() always ignores, e.g. "
+        "timestamp (list of names).",
+        type="args",
+        default=[],
+    )
+    parser.addini(
+        name="structlog_max_events",
+        help="Only keep this many of the most recent events captured in each test.",
+        type="string",
+        default="",
+    )
+    parser.addini(
+        name="structlog_max_bytes",
+        help="Only keep the most recent events captured in each test, up to this "
+        "many bytes (shallow estimate).",
+        type="string",
+        default="",
+    )
+    parser.addini(
+        name="structlog_storage",
+        help="How captured events are stored: 'list' (default) keeps the event "
+        "dicts, 'compact' keeps compact records and rebuilds dicts on access, "
+        "'threaded' keeps a buffer per logging thread and merges them on access, "
+        "'spill' streams events to a temporary file, 'count' only counts events.",
+        type="string",
+        default="list",
+    )
+    parser.addini(
+        name="structlog_copy",
+        help="How captured event dicts are stored: 'reference' (default) keeps the "
+        "event dict itself, 'shallow' keeps a copy, 'frozen' keeps an immutable "
+        "and hashable copy (FrozenEvent).",
+        type="string",
+        default="reference",
+    )
+    parser.addini(
+        name="structlog_track_tasks",
+        help="Record which asyncio task logged each event, for log.events_for(task) "
+        "and the task= argument of log.has / log.count.",
+        type="bool",
+        default=False,
+    )
+
+
+def _ini_int(config: pytest.Config, name: str) -> Optional[int]:
+    value = config.getini(name)
+    if not value:
+        return None
+    try:
+        result = int(value)
+    except ValueError:
+        result = 0
+    if result <= 0:
+        raise pytest.UsageError(
+            f"{name} configuration value must be a positive integer (got: {value!r})"
+        )
+    return result
 
 
 def pytest_configure(config: pytest.Config) -> None:
@@ -311,6 +2687,43 @@ def pytest_configure(config: pytest.Config) -> None:
             )
     settings.report = settings_report
     assert settings_report in ("always", "never", "auto"), settings_report
+    report_section = config.getoption("structlog_report_section")
+    if report_section is None:
+        report_section = config.getini("structlog_report_section")
+        if report_section not in ("always", "never", "auto"):
+            raise pytest.UsageError(
+                f"structlog_report_section configuration value must be one of "
+                f"'always', 'never', or 'auto' (got: {report_section!r})"
+            )
+    settings.report_section = report_section
+    settings.max_events = _ini_int(config, "structlog_max_events")
+    settings.max_bytes = _ini_int(config, "structlog_max_bytes")
+    settings.storage = config.getini("structlog_storage")
+    settings.track_tasks = config.getini("structlog_track_tasks")
+    settings.copy = config.getini("structlog_copy")
+    if settings.copy not in _COPY_POLICIES:
+        choices = ", ".join(map(repr, _COPY_POLICIES))
+        raise pytest.UsageError(
+            f"structlog_copy configuration value must be one of {choices} "
+            f"(got: {settings.copy!r})"
+        )
+    settings.summary = config.getoption("structlog_summary")
+    settings.profile = config.getoption("structlog_profile")
+    settings.snapshot_update = config.getoption("structlog_snapshot_update")
+    settings.snapshot_ignore = frozenset(config.getini("structlog_snapshot_ignore"))
+    if settings.storage not in _STORAGE_CHOICES:
+        choices = ", ".join(map(repr, _STORAGE_CHOICES))
+        raise pytest.UsageError(
+            f"structlog_storage configuration value must be one of {choices} "
+            f"(got: {settings.storage!r})"
+        )
+    config.addinivalue_line(
+        "markers",
+        "structlog(max_events=None, max_bytes=None, storage='list', "
+        "track_tasks=False, copy='reference'): configure the capture of the log "
+        "fixtures: how many of the most recent events to keep, how to store them, "
+        "whether to track asyncio tasks, and how to copy event dicts.",
+    )
     if user_evict and user_keep:
         raise pytest.UsageError(
             "--structlog-keep and --structlog-evict settings are mutually "
@@ -325,21 +2738,23 @@ def pytest_configure(config: pytest.Config) -> None:
     settings.evict["config-file"].update(config.getini("structlog_evict"))
     if user_evict:
         settings.mode = "evict"
+    settings.invalidate()
 
 
 def pytest_unconfigure() -> None:
     """Unconfigure the plugin before test process exits."""
     settings.reset()
+    _collected_stats.clear()
 
 
 def pytest_report_collectionfinish(config: pytest.Config) -> list[str]:
     """Add post-collection information about which pre-configured structlog processors
-    are being used. These only show if verbosity is non-zero, i.e. the user passed -v
-    or -vv when running pytest."""
+    are being used. These only show if verbosity is positive, i.e. the user passed -v
+    or -vv when running pytest (-q makes it negative)."""
     if settings.report == "never":
         return []
     verbosity = config.getoption("verbose", default=0)
-    if settings.report == "auto" and not verbosity:
+    if settings.report == "auto" and verbosity <= 0:
         return []
     tw = config.get_terminal_writer()
     lines = [" pytest-structlog settings ".center(tw.fullwidth, "=")]
@@ -372,3 +2787,61 @@ def pytest_report_collectionfinish(config: pytest.Config) -> list[str]:
         lines.append("".join(line))
     lines.append("=" * tw.fullwidth)
     return lines
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter) -> None:
+    """Reports the tests which logged the most events, like --durations does for the
+    slowest tests, and the most expensive processors when profiling."""
+    if settings.summary:
+        _summarize_events(terminalreporter, settings.summary)
+    if settings.profile:
+        _summarize_profile(terminalreporter, settings.profile)
+
+
+def _summarize_events(tr: pytest.TerminalReporter, n: int) -> None:
+    collected = {k: v for k, v in _collected_stats.items() if "events" in v}
+    if not collected:
+        return
+    ranked = sorted(collected.items(), key=lambda kv: kv[1]["events"], reverse=True)
+    tr.write_sep("=", f"structlog summary: top {n} tests by events")
+    for nodeid, stats in ranked[:n]:
+        tr.write_line(
+            f"{stats['events']:>10} events {stats['duration']:8.2f}s {nodeid}"
+        )
+        if not stats["levels"]:
+            continue
+        levels = ", ".join(f"{k}: {v}" for k, v in sorted(stats["levels"].items()))
+        top = ", ".join(f"{name!r}: {n}" for name, n in stats["top_events"])
+        tr.write_line(f"{'':>10} levels: {levels}")
+        tr.write_line(f"{'':>10} most logged: {top}")
+    total = sum(stats["events"] for stats in collected.values())
+    tr.write_line(f"{total} events were logged by {len(collected)} tests.")
+
+
+def _summarize_profile(tr: pytest.TerminalReporter, n: int) -> None:
+    per_test = {k: v["profile"] for k, v in _collected_stats.items() if "profile" in v}
+    if not per_test:
+        return
+    per_processor: dict[str, list[float]] = {}
+    for profile in per_test.values():
+        for name, (calls, seconds) in profile.items():
+            totals = per_processor.setdefault(name, [0, 0.0])
+            totals[0] += calls
+            totals[1] += seconds
+    ranked = sorted(per_processor.items(), key=lambda kv: kv[1][1], reverse=True)
+    tr.write_sep("=", f"structlog profile: top {n} processors by time")
+    for name, (calls, seconds) in ranked[:n]:
+        per_call = seconds / calls * 1e6 if calls else 0.0
+        tr.write_line(
+            f"{seconds:10.4f}s {int(calls):>10} calls {per_call:10.2f}us/call {name}"
+        )
+    test_times = {
+        nodeid: sum(seconds for _, seconds in profile.values())
+        for nodeid, profile in per_test.items()
+    }
+    ranked_tests = sorted(test_times.items(), key=lambda kv: kv[1], reverse=True)
+    tr.write_sep("=", f"structlog profile: top {n} tests by time in processors")
+    for nodeid, seconds in ranked_tests[:n]:
+        tr.write_line(f"{seconds:10.4f}s {nodeid}")
+    total = sum(test_times.values())
+    tr.write_line(f"{total:.4f}s was spent in processors by {len(test_times)} tests.")
@@ -0,0 +1,79 @@
+import pytest
+import structlog
+
+from pytest_structlog import StructuredLogCapture
+from pytest_structlog import _install
+
+
+@pytest.fixture
+def configure_add_log_level():
+    structlog.configure(
+        processors=[
+            structlog.processors.add_log_level,
+            structlog.processors.JSONRenderer(),
+        ]
+    )
+    yield
+    structlog.reset_defaults()
+
+
+@pytest.fixture
+def configure_without_add_log_level():
+    structlog.configure(processors=[structlog.processors.JSONRenderer()])
+    yield
+    structlog.reset_defaults()
+
+
+def test_capture_skips_level_when_chain_has_it(configure_add_log_level, log):
+    assert not log._add_log_level
+    structlog.get_logger().warning("hello")
+    assert log.events == [{"event": "hello", "level": "warning"}]
+
+
+def test_capture_adds_level_when_chain_lacks_it(configure_without_add_log_level, log):
+    assert log._add_log_level
+    structlog.get_logger().warning("hello")
+    assert log.events == [{"event": "hello", "level": "warning"}]
+
+
+def test_evicted_add_log_level(pytester):
+    pytester.makeini("[pytest]\nstructlog_evict = add_log_level")
+    pytester.makepyfile(
+        """
+        import structlog
+
+        def test_foo(log):
+            assert not log._add_log_level
+            structlog.get_logger().warning("hello")
+            assert log.events == [{"event": "hello"}]
+        """
+    )
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1)
+
+
+@pytest.fixture
+def add_log_level_calls(monkeypatch):
+    calls = []
+    original = structlog.processors.add_log_level
+
+    def add_log_level(logger, method_name, event_dict):
+        calls.append(method_name)
+        return original(logger, method_name, event_dict)
+
+    structlog.configure(processors=[add_log_level])
+    monkeypatch.setattr(structlog.stdlib, "add_log_level", add_log_level)
+    yield calls
+    structlog.reset_defaults()
+
+
+def test_add_log_level_called_once_per_event(add_log_level_calls):
+    calls = add_log_level_calls
+    capture = StructuredLogCapture()
+    with pytest.MonkeyPatch.context() as mp:
+        _install(capture, mp)
+        structlog.get_logger().info("hello")
+        capture._reset()
+    assert calls == ["info"]
+    assert capture.events == [{"event": "hello", "level": "info"}]
+
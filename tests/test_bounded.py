@@ -0,0 +1,109 @@
+import pytest
+import structlog
+
+from pytest_structlog import BoundedEventList
+from pytest_structlog import StructuredLogCapture
+from pytest_structlog import TruncatedCaptureWarning
+
+
+logger = structlog.get_logger()
+
+
+def chatty(n):
+    for i in range(n):
+        logger.info("tick", i=i)
+
+
+@pytest.mark.structlog(max_events=3)
+def test_keeps_most_recent_events(log: StructuredLogCapture):
+    chatty(10)
+    assert isinstance(log.events, BoundedEventList)
+    assert log.events == [
+        {"event": "tick", "level": "info", "i": 7},
+        {"event": "tick", "level": "info", "i": 8},
+        {"event": "tick", "level": "info", "i": 9},
+    ]
+    assert log.events.dropped == 7
+    assert log.events.truncated
+    assert log.has("tick", i=9)
+
+
+@pytest.mark.structlog(max_events=3)
+def test_not_truncated(log: StructuredLogCapture):
+    chatty(3)
+    assert not log.events.truncated
+    assert log.count("tick") == 3
+    assert log.events >= [{"event": "tick", "level": "info", "i": 1}]
+    assert log.events[-1] == {"event": "tick", "level": "info", "i": 2}
+    assert log.events[1:] == [
+        {"event": "tick", "level": "info", "i": 1},
+        {"event": "tick", "level": "info", "i": 2},
+    ]
+
+
+@pytest.mark.structlog(max_events=3)
+def test_helpers_warn_when_truncated(log: StructuredLogCapture):
+    chatty(10)
+    with pytest.warns(TruncatedCaptureWarning, match="7 earlier events were dropped"):
+        assert not log.has("tick", i=0)
+    with pytest.warns(TruncatedCaptureWarning):
+        assert log.count("tick") == 3
+
+
+def test_max_bytes():
+    events = BoundedEventList(max_bytes=2000)
+    for i in range(100):
+        events.append({"event": "tick", "i": i})
+    assert 0 < events.nbytes <= 2000
+    assert events.dropped == 100 - len(events)
+    assert events[-1] == {"event": "tick", "i": 99}
+    events.clear()
+    assert len(events) == events.nbytes == events.dropped == 0
+
+
+def test_comparisons():
+    events = BoundedEventList(max_events=2)
+    events.append({"event": "a"})
+    events.append({"event": "b"})
+    assert events == [{"event": "a"}, {"event": "b"}]
+    assert [{"event": "a"}, {"event": "b"}] == events
+    assert events != [{"event": "a"}]
+    assert events > [{"event": "b"}]
+    assert not events >= [{"event": "b"}, {"event": "a"}]
+    assert {"event": "a"} in events
+    with pytest.raises(IndexError):
+        events[2]
+
+
+def test_ini_option(pytester):
+    pytester.makeini("[pytest]\nstructlog_max_events = 2")
+    pytester.makepyfile(
+        """
+        import structlog
+
+        logger = structlog.get_logger()
+
+        def test_foo(log):
+            for i in range(5):
+                logger.info("tick", i=i)
+            assert [e["i"] for e in log.events] == [3, 4]
+            assert 0
+        """
+    )
+    result = pytester.runpytest()
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*Captured structlog call*",
+            "(3 earlier events were dropped)",
+            "*'i': 3*",
+            "*'i': 4*",
+        ]
+    )
+
+
+def test_ini_option_invalid(pytester):
+    pytester.makeini("[pytest]\nstructlog_max_events = lots")
+    result = pytester.runpytest()
+    assert result.ret != 0
+    result.stderr.fnmatch_lines(["*structlog_max_events*positive integer*"])
@@ -0,0 +1,120 @@
+import logging
+
+import pytest
+import structlog
+
+from pytest_structlog import StructuredLogCapture
+
+
+@pytest.fixture
+def stdlib_configure():
+    structlog.configure(
+        processors=[
+            structlog.stdlib.add_logger_name,
+            structlog.processors.JSONRenderer(),
+        ],
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.BoundLogger,
+    )
+    yield
+    structlog.reset_defaults()
+
+
+def test_chain_ends_without_drop_event(log: StructuredLogCapture, monkeypatch):
+    def explode(*args, **kwargs):
+        raise AssertionError("DropEvent should not be needed")
+
+    monkeypatch.setattr(structlog, "DropEvent", explode)
+    structlog.get_logger().info("hello")
+    assert log.events == [{"event": "hello", "level": "info"}]
+
+
+def test_wrapped_logger_is_not_called(stdlib_configure, log, caplog):
+    caplog.set_level(logging.DEBUG)
+    structlog.get_logger("mylogger").warning("hello", k="v")
+    assert log.events == [{"event": "hello", "k": "v", "level": "warning"}]
+    assert not caplog.records
+
+
+def test_attributes_delegate_to_wrapped_logger(pytester):
+    pytester.makeini("[pytest]\nstructlog_keep = add_logger_name")
+    pytester.makepyfile(
+        """
+        import structlog
+
+        def test_foo(log):
+            logger = structlog.get_logger("mylogger")
+            assert logger.name == "mylogger"
+            assert logger.isEnabledFor(0) in (True, False)
+            logger.info("hello")
+            assert log.events == [
+                {"event": "hello", "level": "info", "logger": "mylogger"},
+            ]
+        """
+    )
+    pytester.makeconftest(
+        """
+        import pytest
+        import structlog
+
+        @pytest.fixture(autouse=True)
+        def configure():
+            structlog.configure(
+                processors=[structlog.stdlib.add_logger_name],
+                logger_factory=structlog.stdlib.LoggerFactory(),
+                wrapper_class=structlog.stdlib.BoundLogger,
+            )
+        """
+    )
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1)
+
+
+def test_kept_processors_see_the_logger_type(pytester):
+    pytester.makeini("[pytest]\nstructlog_keep = logger_type")
+    pytester.makeconftest(
+        """
+        import logging
+
+        import pytest
+        import structlog
+
+        def logger_type(logger, method_name, event_dict):
+            event_dict["stdlib"] = isinstance(logger, logging.Logger)
+            return event_dict
+
+        @pytest.fixture(autouse=True)
+        def configure():
+            structlog.configure(
+                processors=[logger_type],
+                logger_factory=structlog.stdlib.LoggerFactory(),
+                wrapper_class=structlog.stdlib.BoundLogger,
+            )
+            yield
+            structlog.reset_defaults()
+        """
+    )
+    pytester.makepyfile(
+        """
+        def test_foo(log):
+            import structlog
+
+            structlog.get_logger("mylogger").info("hello")
+            assert log.events == [{"event": "hello", "stdlib": True, "level": "info"}]
+        """
+    )
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1)
+
+
+def test_unknown_method_names_are_dropped(log: StructuredLogCapture):
+    logger = structlog.get_logger().bind()
+    logger._proxy_to_logger("audit", "custom method")
+    assert log.events == [{"event": "custom method", "level": "audit"}]
+
+
+def test_loggers_from_other_factories_are_dropped(log: StructuredLogCapture, capsys):
+    logger = structlog.wrap_logger(structlog.PrintLogger())
+    logger.info("hello")
+    assert log.events == [{"event": "hello", "level": "info"}]
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,129 @@
+import pytest
+import structlog
+
+from pytest_structlog import Checkpoint
+from pytest_structlog import EventList
+from pytest_structlog import EventsSince
+from pytest_structlog import StructuredLogCapture
+from pytest_structlog import TruncatedCaptureWarning
+
+logger = structlog.get_logger()
+
+
+def test_since(log: StructuredLogCapture):
+    logger.info("a", step=1)
+    step = log.checkpoint()
+    assert isinstance(step, Checkpoint)
+    assert repr(step) == "<Checkpoint at event 1>"
+    assert not log.since(step).events
+    logger.info("b", step=2)
+    logger.info("a", step=2)
+    since = log.since(step)
+    assert isinstance(since.events, EventsSince)
+    assert since.events == [
+        {"event": "b", "step": 2, "level": "info"},
+        {"event": "a", "step": 2, "level": "info"},
+    ]
+    assert since.events[-1] == {"event": "a", "step": 2, "level": "info"}
+    assert since.has("a", step=2)
+    assert not since.has("a", step=1)
+    assert since.count("a") == 1
+    assert log.count("a") == 2
+    assert since.where(step=2).count() == 2
+    assert since.has(log.matcher("b"))
+    assert since.events >= [log.info("a", step=2)]
+    assert not since.events >= [log.info("a", step=1)]
+    assert log.info("b", step=2) in since.events
+    # events logged after the view was made are included
+    logger.info("c")
+    assert since.has("c")
+    assert len(since.events) == 3
+
+
+def test_since_is_read_only(log: StructuredLogCapture):
+    with pytest.raises(TypeError, match="read-only"):
+        log.since(log.checkpoint()).events.append({})
+
+
+def test_checkpoint_from_another_test(log: StructuredLogCapture):
+    with pytest.raises(ValueError, match="another test"):
+        log.since(Checkpoint(EventList()))
+
+
+def test_scans_only_new_events():
+    capture = StructuredLogCapture()
+    capture.events.extend({"event": f"e{i % 10}", "i": i} for i in range(1000))
+    step = capture.checkpoint()
+    capture.events.extend({"event": f"e{i % 10}", "i": i} for i in range(1000, 1010))
+    since = capture.since(step)
+    assert len(list(since.events._candidates({"event": "e3"}))) == 1
+    assert len(list(since.events._candidates({"i": [1]}))) == 10
+    assert since.has("e3", i=1003)
+    assert not since.has("e3", i=3)
+    assert since.events._find({"event": "e5", "i": 1005}, 0) == 5
+    assert since.events._find({"event": "e5", "i": 5}, 0) == -1
+    assert since.events >= [{"event": "e1", "i": 1001}, {"event": "e9", "i": 1009}]
+
+
+def test_small_list():
+    capture = StructuredLogCapture()
+    capture.events.extend([{"event": "a"}, {"event": "b"}])
+    step = capture.checkpoint()
+    capture.events.append({"event": "a"})
+    assert capture.since(step).count("a") == 1
+
+
+@pytest.mark.structlog(max_events=3)
+def test_bounded(log: StructuredLogCapture):
+    for i in range(5):
+        logger.info("tick", i=i)
+    step = log.checkpoint()
+    logger.info("tock", i=5)
+    logger.info("tock", i=6)
+    since = log.since(step)
+    assert since.events == [
+        {"event": "tock", "i": 5, "level": "info"},
+        {"event": "tock", "i": 6, "level": "info"},
+    ]
+    assert since.count("tock") == 2
+    logger.info("tock", i=7)
+    logger.info("tock", i=8)
+    with pytest.warns(TruncatedCaptureWarning, match="1 events logged since"):
+        assert since.count("tock") == 3
+
+
+@pytest.mark.parametrize("storage", ["compact", "threaded", "spill"])
+def test_other_storage_find_walks_once(storage, monkeypatch):
+    capture = StructuredLogCapture(storage=storage)
+    for i in range(20):
+        capture.events.append({"event": "a", "i": i})
+    step = capture.checkpoint()
+    for i in range(20, 40):
+        capture.events.append({"event": "a", "i": i})
+    since = capture.since(step)
+    monkeypatch.setattr(type(capture.events), "_get", None)
+    assert since.events._find({"event": "a", "i": 25}, 0) == 5
+    assert since.events._find({"event": "a", "i": 25}, 6) == -1
+    assert since.events._find({"event": "a", "i": 5}, 0) == -1
+    assert since.events >= [{"event": "a", "i": 21}, {"event": "a", "i": 39}]
+    assert list(since.events)[0] == {"event": "a", "i": 20}
+
+
+@pytest.mark.parametrize("storage", ["compact", "threaded", "spill"])
+def test_other_storage(pytester, storage):
+    pytester.makepyfile(f"""
+        import pytest
+        import structlog
+
+        @pytest.mark.structlog(storage={storage!r})
+        def test_since(log):
+            structlog.get_logger().info("a", i=1)
+            step = log.checkpoint()
+            structlog.get_logger().info("a", i=2)
+            since = log.since(step)
+            assert since.count("a") == 1
+            assert since.events == [{{"event": "a", "i": 2, "level": "info"}}]
+            assert since.events >= [{{"event": "a", "i": 2, "level": "info"}}]
+            assert not since.events >= [{{"event": "a", "i": 1, "level": "info"}}]
+        """)
+    pytester.runpytest().assert_outcomes(passed=1)
@@ -0,0 +1,89 @@
+import tracemalloc
+
+import pytest
+import structlog
+
+from pytest_structlog import CompactEventList
+from pytest_structlog import EventList
+from pytest_structlog import StructuredLogCapture
+
+
+logger = structlog.get_logger()
+
+
+@pytest.mark.structlog(storage="compact")
+def test_compact_capture(log: StructuredLogCapture):
+    assert isinstance(log.events, CompactEventList)
+    logger.info("a", k="v")
+    logger.warning("b", k="v", n=[1])
+    assert log.events == [
+        {"event": "a", "k": "v", "level": "info"},
+        {"event": "b", "k": "v", "n": [1], "level": "warning"},
+    ]
+    assert log.events[1] == {"event": "b", "k": "v", "n": [1], "level": "warning"}
+    assert log.events[-1]["n"] == [1]
+    assert log.has("b", n=[1])
+    assert log.count("a", k="v") == 1
+    assert log.events >= [{"event": "b", "k": "v", "n": [1], "level": "warning"}]
+    assert {"event": "a", "k": "v", "level": "info"} in log.events
+
+
+def test_keys_are_shared():
+    events = CompactEventList()
+    events.append({"event": "a", "i": 1})
+    events.append({"event": "b", "i": 2})
+    events.append({"i": 3, "event": "c"})
+    assert events._records[0].keys is events._records[1].keys
+    assert events._records[2].keys == ("i", "event")
+    assert list(events[2]) == ["i", "event"]
+
+
+def test_materialized_dicts_are_copies():
+    events = CompactEventList()
+    events.append({"event": "a"})
+    events[0]["event"] = "b"
+    assert events == [{"event": "a"}]
+
+
+def test_uses_less_memory():
+    def measure(events):
+        tracemalloc.start()
+        for i in range(5000):
+            events.append(
+                {"event": "tick", "level": "info", "logger": "x", "timestamp": i}
+            )
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return size
+
+    assert measure(CompactEventList()) < 0.8 * measure(EventList())
+
+
+def test_invalid_combinations():
+    with pytest.raises(ValueError, match="storage must be"):
+        StructuredLogCapture(storage="columnar")
+    with pytest.raises(ValueError, match="does not support max_events"):
+        StructuredLogCapture(storage="compact", max_events=10)
+
+
+def test_ini_option(pytester):
+    pytester.makeini("[pytest]\nstructlog_storage = compact")
+    pytester.makepyfile(
+        """
+        import structlog
+
+        def test_foo(log):
+            assert type(log.events).__name__ == "CompactEventList"
+            structlog.get_logger().info("a")
+            assert log.events == [{"event": "a", "level": "info"}]
+        """
+    )
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1)
+
+
+def test_ini_option_invalid(pytester):
+    pytester.makeini("[pytest]\nstructlog_storage = columnar")
+    result = pytester.runpytest()
+    assert result.ret != 0
+    result.stderr.fnmatch_lines(["*structlog_storage configuration value*"])
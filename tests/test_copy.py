@@ -0,0 +1,129 @@
+import copy
+import pickle
+
+import pytest
+import structlog
+
+from pytest_structlog import EventList
+from pytest_structlog import FrozenEvent
+from pytest_structlog import StructuredLogCapture
+
+
+def log_and_mutate(capture, event_dict):
+    with pytest.raises(structlog.DropEvent):
+        capture(None, "info", event_dict)
+    event_dict["mutated"] = True
+
+
+def test_reference():
+    capture = StructuredLogCapture()
+    event_dict = {"event": "a"}
+    log_and_mutate(capture, event_dict)
+    assert capture.events[0] is event_dict
+    assert capture.events[0]["mutated"]
+
+
+def test_shallow():
+    capture = StructuredLogCapture(copy="shallow")
+    event_dict = {"event": "a", "items": []}
+    log_and_mutate(capture, event_dict)
+    assert capture.events == [{"event": "a", "items": [], "level": "info"}]
+    event_dict["items"].append(1)
+    assert capture.events[0]["items"] == [1]
+
+
+def test_frozen():
+    capture = StructuredLogCapture(copy="frozen")
+    event_dict = {"event": "a", "items": [{"k": [1]}], "tags": {"x"}, "t": (1, [2])}
+    log_and_mutate(capture, event_dict)
+    event_dict["items"][0]["k"].append(2)
+    [event] = capture.events
+    assert isinstance(event, FrozenEvent)
+    assert event == {
+        "event": "a",
+        "items": [{"k": [1]}],
+        "tags": {"x"},
+        "t": (1, [2]),
+        "level": "info",
+    }
+    assert capture.has("a", items=[{"k": [1]}], tags={"x"})
+    with pytest.raises(TypeError, match="FrozenEvent is immutable"):
+        event["event"] = "b"
+    with pytest.raises(TypeError, match="FrozenEvent is immutable"):
+        event.update(k=1)
+    with pytest.raises(TypeError, match="_FrozenList is immutable"):
+        event["items"].append(1)
+    with pytest.raises(TypeError, match="FrozenEvent is immutable"):
+        event["items"][0]["k"] = 2
+    assert isinstance(event["tags"], frozenset)
+
+
+def test_frozen_hashable():
+    a = FrozenEvent(event="a", items=[1, [2]], d={"k": "v"})
+    b = FrozenEvent({"event": "a", "d": {"k": "v"}, "items": [1, [2]]})
+    assert hash(a) == hash(b)
+    assert len({a, b}) == 1
+    assert a in set(EventList([b]))
+    with pytest.raises(TypeError):
+        hash(FrozenEvent(event="a", obj=bytearray()))
+
+
+def test_frozen_copy_and_pickle():
+    event = FrozenEvent(event="a", items=[1])
+    assert copy.copy(event) is event
+    assert copy.deepcopy(event) == event
+    clone = pickle.loads(pickle.dumps(event))
+    assert type(clone) is FrozenEvent
+    assert type(clone["items"]).__name__ == "_FrozenList"
+    assert clone == event
+
+
+def test_frozen_values_are_indexed():
+    events = EventList(
+        FrozenEvent(event=f"e{i % 10}", tags=[i % 3], d={"i": i}) for i in range(300)
+    )
+    assert len(list(events._candidates({"tags": events[0]["tags"]}))) == 100
+    assert events._index is not None
+    assert ("tags", (0,)) not in events._index.pairs
+    assert len(events._index.pairs) == 10 + 3 + 300
+    assert events >= [{"event": "e1", "tags": [1], "d": {"i": 1}}]
+    # unhashable frozen values are not indexed
+    events.append(FrozenEvent(event="x", tags=[bytearray()]))
+    assert events.count({"event": "x", "tags": [bytearray()]}) == 1
+    assert len(events._indexed().loose["tags"]) == 1
+
+
+@pytest.mark.parametrize("storage", ["compact", "spill", "count"])
+def test_unsupported_storage(storage):
+    with pytest.raises(ValueError, match="does not support copy='frozen'"):
+        StructuredLogCapture(storage=storage, copy="frozen")
+
+
+def test_invalid_policy():
+    with pytest.raises(ValueError, match="copy must be one of"):
+        StructuredLogCapture(copy="deep")
+
+
+def test_ini_option(pytester):
+    pytester.makeini("[pytest]\nstructlog_copy = frozen")
+    pytester.makepyfile("""
+        import pytest
+        import structlog
+
+        def test_frozen(log):
+            structlog.get_logger().info("a")
+            assert type(log.events[0]).__name__ == "FrozenEvent"
+
+        @pytest.mark.structlog(copy="reference")
+        def test_marker(log):
+            structlog.get_logger().info("a")
+            assert type(log.events[0]) is dict
+        """)
+    pytester.runpytest().assert_outcomes(passed=2)
+
+
+def test_ini_option_invalid(pytester):
+    pytester.makeini("[pytest]\nstructlog_copy = deep")
+    result = pytester.runpytest()
+    assert result.ret != 0
+    result.stderr.fnmatch_lines(["*structlog_copy configuration value*"])
@@ -0,0 +1,72 @@
+import pytest
+import structlog
+
+from pytest_structlog import CountingEventList
+from pytest_structlog import StructuredLogCapture
+
+logger = structlog.get_logger()
+
+
+@pytest.mark.structlog(storage="count")
+def test_events_are_counted(log: StructuredLogCapture):
+    assert isinstance(log.events, CountingEventList)
+    logger.info("a")
+    logger.warning("b", k="v")
+    assert len(log.events) == 2
+    assert repr(log.events) == "<CountingEventList: 2 events>"
+
+
+@pytest.mark.structlog(storage="count")
+def test_events_are_not_readable(log: StructuredLogCapture):
+    logger.info("a")
+    with pytest.raises(RuntimeError, match="only counted"):
+        log.has("a")
+    with pytest.raises(RuntimeError, match="only counted"):
+        log.events[0]
+    with pytest.raises(RuntimeError, match="only counted"):
+        assert log.events == [{"event": "a", "level": "info"}]
+
+
+@pytest.mark.structlog(storage="count")
+def test_processors_still_configured(log: StructuredLogCapture):
+    processors = structlog.get_config()["processors"]
+    assert processors[-1] is log
+    assert "TimeStamper" not in [type(p).__name__ for p in processors]
+    assert structlog.configure.__name__ == "no_op"
+
+
+def test_level_is_not_added():
+    capture = StructuredLogCapture(storage="count")
+    assert not capture._add_log_level
+    event_dict = {"event": "a"}
+    with pytest.raises(structlog.DropEvent):
+        capture(None, "info", event_dict)
+    assert event_dict == {"event": "a"}
+
+
+def test_track_tasks_unsupported():
+    with pytest.raises(ValueError, match="does not support track_tasks"):
+        StructuredLogCapture(storage="count", track_tasks=True)
+
+
+def test_counted_report_section(pytester):
+    pytester.makeini("[pytest]\nstructlog_storage = count")
+    pytester.makepyfile("""
+        import structlog
+
+        def test_fail(log):
+            structlog.get_logger().info("a")
+            structlog.get_logger().info("b")
+            assert 0
+        """)
+    result = pytester.runpytest("--structlog-summary=1")
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*Captured structlog call*",
+            "(2 events were counted, but not kept)",
+            "*2 events *s test_counted_report_section.py::test_fail",
+            "2 events were logged by 1 tests.",
+        ]
+    )
+    result.stdout.no_fnmatch_line("*levels:*")
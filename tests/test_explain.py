@@ -0,0 +1,169 @@
+import pytest
+import structlog
+
+from pytest_structlog import EventList
+from pytest_structlog import StructuredLogCapture
+from pytest_structlog import _explain_missing
+from pytest_structlog import _explain_subseq
+from pytest_structlog import pytest_assertrepr_compare
+
+logger = structlog.get_logger()
+
+
+def make_events(n):
+    return EventList({"event": f"e{i % 10}", "i": i} for i in range(n))
+
+
+@pytest.mark.parametrize("n", [50, 1000], ids=["scan", "index"])
+def test_closest_matches(n):
+    events = make_events(n)
+    lines = _explain_missing(events, {"event": "e3", "i": 4})
+    assert lines == [
+        "closest captured events:",
+        "  event 3: {'event': 'e3', 'i': 3}",
+        "    differs by 'i': 3 != 4",
+        "  event 4: {'event': 'e4', 'i': 4}",
+        "    differs by 'event': 'e4' != 'e3'",
+        "  event 13: {'event': 'e3', 'i': 13}",
+        "    differs by 'i': 13 != 4",
+    ]
+
+
+def test_no_close_match():
+    lines = _explain_missing(make_events(10), {"event": "nope"})
+    assert lines == [
+        "no captured event shares any key/value pair with {'event': 'nope'}"
+    ]
+
+
+def test_explain_subseq():
+    events = make_events(1000)
+    expected = [{"event": "e5", "i": 5}, {"event": "e1", "i": 2}]
+    lines = _explain_subseq(expected, events)
+    assert lines[:3] == [
+        "expected event 1 was not found after event 5 (of 1000 captured):",
+        "  {'event': 'e1', 'i': 2}",
+        "closest captured events:",
+    ]
+    # only events after the previous match are candidates
+    assert lines[3] == "  event 11: {'event': 'e1', 'i': 11}"
+
+
+def test_explain_subseq_after_other_comparisons(log: StructuredLogCapture):
+    for event in "abc":
+        logger.info(event)
+    assert not log.events >= [log.info("zzz"), log.info("c")]
+    expected = [log.info("a"), log.info("b"), log.info("c"), log.info("d")]
+    assert not log.events >= expected
+    lines = _explain_subseq(expected, log.events)
+    assert lines[0] == "expected event 3 was not found after event 2 (of 3 captured):"
+
+
+def test_explain_subseq_out_of_order(log: StructuredLogCapture):
+    for event in "abc":
+        logger.info(event)
+    expected = [log.info("c"), log.info("b")]
+    assert not log.events >= expected
+    assert _explain_subseq(expected, log.events) == [
+        "expected event 1 was not found after event 2 (of 3 captured):",
+        "  {'level': 'info', 'event': 'b'}",
+        "it was found at event 1, before event 2 which matched expected event 0",
+    ]
+
+
+def test_explain_subseq_closest_before_previous_match():
+    events = EventList([{"event": "a", "n": 1}, {"event": "b"}, {"event": "c"}])
+    lines = _explain_subseq([{"event": "b"}, {"event": "a", "n": 2}], events)
+    assert lines[2:] == [
+        "closest captured events (none after event 1):",
+        "  event 0: {'event': 'a', 'n': 1}",
+        "    differs by 'n': 1 != 2",
+    ]
+
+
+def test_explain_subseq_plain_lists():
+    expected = [{"event": "a"}, {"event": "c"}, {"event": "a"}]
+    events = [{"event": "b"}, {"event": "a"}, {"event": "c"}]
+    assert _explain_subseq(expected, events)[0] == (
+        "expected event 2 was not found after event 2 (of 3 captured):"
+    )
+
+
+def test_assertrepr_compare_is_bounded():
+    events = make_events(100_000)
+    expected = [{"event": "e1", "i": -1}]
+    for lines in (
+        pytest_assertrepr_compare(None, ">=", events, expected),
+        pytest_assertrepr_compare(None, "<=", expected, events),
+        pytest_assertrepr_compare(None, "in", expected[0], events),
+    ):
+        assert len(lines) <= 10
+        assert sum(map(len, lines)) < 2000
+    lines = pytest_assertrepr_compare(None, "==", events, expected)
+    assert lines == [
+        "<EventList of 100000 events> == <list of 1 expected events>",
+        "first difference at event 0:",
+        "  {'event': 'e0', 'i': 0}",
+        "  != {'event': 'e1', 'i': -1}",
+        "  differing keys: 'event', 'i'",
+        "left has 100000 events, right has 1",
+    ]
+
+
+def test_assertrepr_compare_ignores_other_types():
+    assert pytest_assertrepr_compare(None, "==", [1], [2]) is None
+    assert pytest_assertrepr_compare(None, ">=", [1], make_events(1)) is None
+
+
+def test_strict_comparison():
+    events = make_events(2)
+    lines = pytest_assertrepr_compare(None, ">", events, list(events))
+    assert lines[1] == "the captured events are not more than the expected events"
+
+
+def test_assert_has(log: StructuredLogCapture):
+    logger.info("hello", k="v")
+    log.assert_has("hello", k="v")
+    with pytest.raises(AssertionError) as excinfo:
+        log.assert_has("hello", k="w")
+    assert str(excinfo.value) == "\n".join(
+        [
+            "event not found: {'k': 'w', 'event': 'hello'}",
+            "closest captured events:",
+            "  event 0: {'k': 'v', 'event': 'hello', 'level': 'info'}",
+            "    differs by 'k': 'v' != 'w'",
+        ]
+    )
+
+
+def test_assert_subsequence(log: StructuredLogCapture):
+    logger.info("a")
+    logger.info("b")
+    log.assert_subsequence([log.info("a"), log.info("b")])
+    with pytest.raises(AssertionError, match="expected event 1 was not found"):
+        log.assert_subsequence([log.info("b"), log.info("a")])
+
+
+def test_failure_output(pytester):
+    pytester.makepyfile("""
+        import structlog
+
+        def test_fail(log):
+            for i in range(10000):
+                structlog.get_logger().info("tick", i=i)
+            assert log.events >= [{"event": "tick", "i": 3, "level": "debug"}]
+        """)
+    result = pytester.runpytest("-vv", "--structlog-report-section=never")
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "E       AssertionError: assert <EventList of 10000 events> >= "
+            "<list of 1 expected events>",
+            "E         expected event 0 was not found anywhere (of 10000 captured):",
+            "E           {'event': 'tick', 'i': 3, 'level': 'debug'}",
+            "E         closest captured events:",
+            "E           event 3: {'i': 3, 'event': 'tick', 'level': 'info'}",
+            "E             differs by 'level': 'info' != 'debug'",
+        ]
+    )
+    assert len(result.outlines) < 100
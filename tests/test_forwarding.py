@@ -0,0 +1,114 @@
+import multiprocessing
+import os
+import pickle
+import socket
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+import structlog
+
+from pytest_structlog import EventForwarder
+from pytest_structlog import StructuredLogCapture
+
+logger = structlog.get_logger()
+
+
+def work(i):
+    structlog.get_logger().info("worked", i=i, pid=os.getpid())
+    return i
+
+
+def unpicklable(i):
+    structlog.get_logger().info("lock", lock=threading.Lock())
+
+
+@pytest.fixture(params=["fork", "spawn"])
+def mp_context(request):
+    if request.param not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"{request.param} start method is not available")
+    return multiprocessing.get_context(request.param)
+
+
+def test_events_from_pool(log: StructuredLogCapture, mp_context):
+    logger.info("parent")
+    with ProcessPoolExecutor(
+        2, mp_context=mp_context, initializer=log.forwarder(batch_size=3)
+    ) as pool:
+        assert list(pool.map(work, range(10))) == list(range(10))
+    log.drain()
+    assert log.events[0] == {"event": "parent", "level": "info"}
+    assert sorted(e["i"] for e in log.events[1:]) == list(range(10))
+    assert all(e["pid"] != os.getpid() for e in log.events[1:])
+    assert log.count("worked", level="info") == 10
+
+
+def test_processors_are_filtered_in_children(log: StructuredLogCapture, mp_context):
+    with ProcessPoolExecutor(
+        1, mp_context=mp_context, initializer=log.forwarder()
+    ) as pool:
+        pool.submit(work, 1).result()
+    log.drain()
+    [event] = log.events
+    # no timestamp, and not rendered: only the kept processors were used
+    assert set(event) == {"event", "i", "pid", "level"}
+
+
+def test_unpicklable_values(log: StructuredLogCapture, mp_context):
+    with ProcessPoolExecutor(
+        1, mp_context=mp_context, initializer=log.forwarder()
+    ) as pool:
+        pool.submit(unpicklable, 1).result()
+    log.drain()
+    [event] = log.events
+    assert event["lock"].startswith("<unlocked _thread.lock object")
+
+
+def test_forwarder_is_picklable(log: StructuredLogCapture):
+    forwarder = log.forwarder()
+    assert isinstance(forwarder, EventForwarder)
+    clone = pickle.loads(pickle.dumps(forwarder))
+    assert clone.address == forwarder.address
+    assert log.forwarder().address == forwarder.address
+
+
+def test_wrong_token_is_rejected(log: StructuredLogCapture):
+    forwarder = log.forwarder()
+    sock = socket.socket(forwarder.family, socket.SOCK_STREAM)
+    sock.connect(forwarder.address)
+    payload = pickle.dumps([{"event": "injected"}])
+    for frame in b"nope", payload:
+        sock.sendall(len(frame).to_bytes(4, "big") + frame)
+    log.drain()
+    assert not log.events
+    assert sock.recv(1) == b""  # disconnected
+    sock.close()
+
+
+def test_drain_without_forwarder(log: StructuredLogCapture):
+    log.drain()
+
+
+def test_receiver_stopped_after_test(pytester):
+    pytester.makepyfile("""
+        import os
+
+        def test_one(log_module):
+            forwarder = log_module.forwarder()
+            assert os.path.exists(forwarder.address)
+            test_one.address = forwarder.address
+
+        def test_two(log_module):
+            assert log_module._receiver is None
+            assert not os.path.exists(test_one.address)
+        """)
+    pytester.runpytest().assert_outcomes(passed=2)
+
+
+def test_wait_for_forwarded_event(log: StructuredLogCapture, mp_context):
+    with ProcessPoolExecutor(
+        1, mp_context=mp_context, initializer=log.forwarder(batch_size=1)
+    ) as pool:
+        pool.submit(work, 7).result()
+        event = log.wait_for("worked", timeout=10, i=7)
+    assert event["pid"] != os.getpid()
@@ -0,0 +1,127 @@
+import copy
+import sys
+import threading
+from unittest import mock
+
+import pytest
+import structlog
+
+from pytest_structlog import EventList
+from pytest_structlog import StructuredLogCapture
+
+
+logger = structlog.get_logger()
+
+
+def chatty(n):
+    for i in range(n):
+        logger.info("tick", i=i, parity=i % 2, payload=[i])
+    logger.warning("done", n=n)
+
+
+def test_has_and_count_on_large_capture(log: StructuredLogCapture):
+    chatty(500)
+    assert log.has("tick", i=123)
+    assert log.has("tick", i=123, parity=1, level="info")
+    assert not log.has("tick", i=123, parity=0)
+    assert not log.has("tick", i=500)
+    assert log.has("done", n=500)
+    assert log.count("tick") == 500
+    assert log.count("tick", parity=1) == 250
+    assert log.count("tick", level="warning") == 0
+
+
+def test_index_maintained_on_append(log: StructuredLogCapture):
+    chatty(200)
+    assert log.count("tick", parity=0) == 100
+    assert log.events._index is not None
+    logger.info("tick", parity=0)
+    assert log.count("tick", parity=0) == 101
+    assert log.has("tick", parity=0, level="info")
+
+
+@pytest.fixture
+def frequent_thread_switches():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+@pytest.mark.usefixtures("frequent_thread_switches")
+def test_concurrent_appends():
+    events = EventList({"event": "e", "i": i} for i in range(200))
+    list(events._candidates({"i": 0}))
+
+    def work(t):
+        for i in range(2000):
+            events.append({"event": "w", "t": t, "i": i})
+
+    threads = [threading.Thread(target=work, args=(t,)) for t in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    found = {(e["t"], e["i"]) for e in events._candidates({"event": "w"})}
+    assert len(found) == 8 * 2000
+
+
+def test_unhashable_context_values(log: StructuredLogCapture):
+    chatty(200)
+    assert log.has("tick", payload=[7])
+    assert log.count("tick", payload=[7]) == 1
+    assert not log.has("tick", payload=[7], i=8)
+
+
+def test_custom_equality_values(log: StructuredLogCapture):
+    chatty(200)
+    assert log.count("tick", i=mock.ANY) == 200
+    assert log.has("done", n=pytest.approx(200.0001, rel=1e-3))
+
+
+def test_unindexable_event_values_are_still_found(log: StructuredLogCapture):
+    chatty(200)
+    logger.info("approx", x=pytest.approx(1.0))
+    logger.info("equal", x=1)
+    assert log.has("approx", x=1.0)
+    assert log.count("equal", x=1.0) == 1
+    assert log.count("equal", x=True) == 1
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda events: events.clear(),
+        lambda events: events.pop(0),
+        lambda events: events.insert(0, {"event": "x"}),
+        lambda events: events.__setitem__(0, {"event": "x"}),
+        lambda events: events.__delitem__(slice(0, 5)),
+        lambda events: events.reverse(),
+        lambda events: events.remove(events[0]),
+    ],
+)
+def test_mutation_invalidates_index(mutate):
+    events = EventList({"event": "e", "i": i} for i in range(200))
+    assert events._candidates({"i": 3}) is not events
+    assert events._index is not None
+    mutate(events)
+    assert events._index is None
+    expected = [e for e in events if e.get("i") == 3]
+    assert list(events._candidates({"i": 3})) == expected
+
+
+def test_extend_maintains_index():
+    events = EventList({"event": "e", "i": i} for i in range(200))
+    list(events._candidates({"i": 0}))
+    events.extend([{"event": "e", "i": 0}])
+    events += [{"event": "e", "i": 0}]
+    assert len(list(events._candidates({"i": 0}))) == 3
+
+
+def test_copies_do_not_share_index():
+    events = EventList({"event": "e", "i": i} for i in range(200))
+    list(events._candidates({"i": 0}))
+    for clone in copy.copy(events), copy.deepcopy(events):
+        assert type(clone) is EventList
+        assert clone == events
+        assert clone._index is None
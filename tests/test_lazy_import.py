@@ -0,0 +1,48 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def test_import_is_lazy():
+    code = """if 1:
+        import sys
+        import pytest_structlog
+        lazy = ["asyncio", "hmac", "multiprocessing.util", "pickle", "structlog"]
+        print(*[name for name in lazy if name in sys.modules])
+    """
+    proc = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+    assert proc.stdout.split() == []
+
+
+@pytest.mark.parametrize("args", [[], ["-q"]], ids=["default", "quiet"])
+def test_structlog_not_imported_without_fixture(pytester, args):
+    pytester.makepyfile(
+        """
+        import sys
+
+        def test_plain():
+            assert "structlog" not in sys.modules
+        """
+    )
+    result = pytester.runpytest_subprocess(*args)
+    result.assert_outcomes(passed=1)
+
+
+def test_lazy_module_is_replaced(pytester):
+    pytester.makepyfile(
+        """
+        import structlog
+
+        import pytest_structlog
+
+        def test_log(log):
+            structlog.get_logger().info("hello")
+            assert pytest_structlog.structlog is structlog
+            assert log.has("hello")
+        """
+    )
+    result = pytester.runpytest_subprocess()
+    result.assert_outcomes(passed=1)
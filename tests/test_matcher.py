@@ -0,0 +1,93 @@
+import re
+from unittest import mock
+
+import pytest
+import structlog
+
+from pytest_structlog import EventList
+from pytest_structlog import EventMatcher
+from pytest_structlog import StructuredLogCapture
+
+logger = structlog.get_logger()
+
+
+def test_matcher(log: StructuredLogCapture):
+    logger.info("started", pid=123, elapsed=0.30000000000000004)
+    logger.info("started", pid=0, elapsed=1)
+    logger.warning("stopping", reason="disk full")
+    started = log.matcher("started", pid=lambda pid: pid > 0)
+    assert isinstance(started, EventMatcher)
+    assert log.has(started)
+    assert log.count(started) == 1
+    assert log.count(log.matcher("started")) == 2
+    assert log.has(log.matcher("started", elapsed=pytest.approx(0.3)))
+    assert log.has(log.matcher(re.compile("^stop"), reason=re.compile("full")))
+    assert not log.has(log.matcher(re.compile("^stop"), reason=re.compile("^full")))
+    assert not log.has(log.matcher("started", missing=lambda v: True))
+
+
+def test_where(log: StructuredLogCapture):
+    logger.info("a", i=1)
+    logger.warning("a", i=2)
+    logger.info("b", i=3)
+    odd = log.matcher(re.compile("[ab]"), i=lambda i: i % 2)
+    assert log.where(odd).values("i") == [1, 3]
+    assert log.where(odd, level="info").where(event="b").count() == 1
+    assert log.where(level="info").where(odd).count() == 2
+    assert repr(log.where(odd, level="info")).startswith(
+        "<EventQuery where(EventMatcher("
+    )
+
+
+def test_comparisons(log: StructuredLogCapture):
+    logger.info("a", i=1)
+    logger.info("b", i=2)
+    a = log.matcher("a", i=1)
+    b = log.matcher(re.compile("b"))
+    assert log.events == [a, b]
+    assert log.events >= [b]
+    assert not log.events >= [b, a]
+    assert [a, b] <= log.events
+    assert b in log.events
+    assert a == {"event": "a", "i": 1}
+    assert a != {"event": "a", "i": 2}
+    assert {"event": "a", "i": 1} == a
+
+
+def test_comparisons_with_index():
+    events = EventList({"event": f"e{i % 10}", "i": i} for i in range(1000))
+    list(events._candidates({"event": "e0"}))
+    assert events._index is not None
+    big = EventMatcher("e5", i=lambda i: i > 900)
+    assert events >= [EventMatcher("e5"), big]
+    assert events._find(big, 0) == 905
+    assert events._find(EventMatcher(re.compile("e5"), i=905), 0) == 905
+
+
+def test_check_order():
+    matcher = EventMatcher(
+        re.compile("x"), f=len, approx=pytest.approx(1), any=mock.ANY, k="v"
+    )
+    assert [k for k, _, _ in matcher._checks] == ["k", "approx", "any", "event", "f"]
+    assert matcher._index_context == {"k": "v"}
+    assert EventMatcher("x", k=1)._index_context == {"k": 1, "event": "x"}
+
+
+def test_types_are_values():
+    assert EventMatcher("x", cls=int) == {"event": "x", "cls": int}
+    assert EventMatcher("x", cls=int) != {"event": "x", "cls": 1}
+
+
+def test_context_with_matcher(log: StructuredLogCapture):
+    with pytest.raises(TypeError, match="can not be combined"):
+        log.has(log.matcher("a"), k="v")
+
+
+def test_explanation(log: StructuredLogCapture):
+    logger.info("a", i=1)
+    with pytest.raises(AssertionError) as excinfo:
+        log.assert_has(log.matcher("a", i=lambda i: i > 1))
+    lines = str(excinfo.value).splitlines()
+    assert lines[0].startswith("event not found: EventMatcher(event='a', i=<function")
+    assert lines[2] == "  event 0: {'i': 1, 'event': 'a', 'level': 'info'}"
+    assert lines[3].startswith("    differs by 'i': 1 != <function")
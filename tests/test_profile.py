@@ -0,0 +1,101 @@
+import pytest
+import structlog
+
+from pytest_structlog import StructuredLogCapture
+from pytest_structlog import _ProfiledProcessor
+
+TESTS = """
+import structlog
+
+logger = structlog.get_logger()
+
+def test_chatty(log):
+    for i in range(50):
+        logger.info("tick", i=i)
+
+def test_quiet(log):
+    logger.info("tock")
+
+def test_no_log_fixture():
+    pass
+"""
+
+
+def slow_processor(logger, method_name, event_dict):
+    return event_dict
+
+
+def test_profiled_processor_accumulates():
+    capture = StructuredLogCapture()
+    profiled = _ProfiledProcessor(slow_processor, capture)
+    assert profiled.name == "slow_processor"
+    for _ in range(3):
+        assert profiled(None, "info", {"event": "a"}) == {"event": "a"}
+    calls, seconds = capture._profile["slow_processor"]
+    assert calls == 3
+    assert seconds >= 0
+
+
+def test_profiled_processor_counts_dropped_events():
+    capture = StructuredLogCapture()
+    profiled = _ProfiledProcessor(capture, capture)
+    with pytest.raises(structlog.DropEvent):
+        profiled(None, "info", {"event": "a"})
+    assert capture._profile["StructuredLogCapture"][0] == 1
+    assert capture.events == [{"event": "a", "level": "info"}]
+
+
+def test_profile_report(pytester):
+    pytester.makepyfile(TESTS)
+    result = pytester.runpytest("--structlog-profile=3")
+    result.assert_outcomes(passed=3)
+    result.stdout.fnmatch_lines(
+        [
+            "*= structlog profile: top 3 processors by time =*",
+            "*s         51 calls *us/call StructuredLogCapture",
+            "*= structlog profile: top 3 tests by time in processors =*",
+            "*s test_profile_report.py::test_chatty",
+            "*s test_profile_report.py::test_quiet",
+            "*s was spent in processors by 2 tests.",
+        ]
+    )
+    result.stdout.no_fnmatch_line("*test_no_log_fixture*")
+    result.stdout.no_fnmatch_line("*structlog summary*")
+
+
+def test_profile_per_test(pytester):
+    pytester.makepyfile("""
+        import structlog
+
+        def test_one(log_module):
+            structlog.get_logger().info("a")
+            structlog.get_logger().info("b")
+            assert log_module._profile["StructuredLogCapture"][0] == 2
+
+        def test_two(log_module):
+            assert log_module._profile == {}
+            structlog.get_logger().info("c")
+            assert log_module._profile["StructuredLogCapture"][0] == 1
+        """)
+    result = pytester.runpytest("--structlog-profile=1")
+    result.assert_outcomes(passed=2)
+
+
+def test_no_profile_by_default(pytester):
+    pytester.makepyfile(TESTS)
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=3)
+    result.stdout.no_fnmatch_line("*structlog profile*")
+
+
+def test_profile_xdist(pytester):
+    pytest.importorskip("xdist")
+    pytester.makepyfile(TESTS)
+    result = pytester.runpytest("-n", "2", "--structlog-profile=3")
+    result.assert_outcomes(passed=3)
+    result.stdout.fnmatch_lines(
+        [
+            "*s         51 calls *us/call StructuredLogCapture",
+            "*s was spent in processors by 2 tests.",
+        ]
+    )
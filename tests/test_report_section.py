@@ -0,0 +1,68 @@
+import pytest
+
+
+TESTS = """
+import structlog
+
+logger = structlog.get_logger()
+
+def test_pass(log):
+    logger.info("from-passing-test")
+
+def test_fail(log):
+    logger.info("from-failing-test")
+    assert 0
+"""
+
+
+@pytest.fixture
+def testfile(pytester):
+    pytester.makepyfile(TESTS)
+
+
+def test_auto_renders_failed_only(pytester, testfile):
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(["*Captured structlog call*", "*from-failing-test*"])
+    result.stdout.no_fnmatch_line("*from-passing-test*")
+
+
+def test_auto_renders_passed_with_rP(pytester, testfile):
+    result = pytester.runpytest("-rP")
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(["*from-failing-test*", "*from-passing-test*"])
+
+
+def test_auto_does_not_attach_section_to_passing_reports(pytester, testfile):
+    reprec = pytester.inline_run()
+    [passed] = reprec.getreports("pytest_runtest_logreport")[1:2]
+    assert passed.passed
+    assert not [name for name, _ in passed.sections if "structlog" in name]
+
+
+def test_never_cmdline(pytester, testfile):
+    result = pytester.runpytest("--structlog-report-section=never")
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.no_fnmatch_line("*Captured structlog call*")
+
+
+def test_never_ini(pytester, testfile):
+    pytester.makeini("[pytest]\nstructlog_report_section = never")
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.no_fnmatch_line("*Captured structlog call*")
+
+
+def test_always(pytester, testfile):
+    reprec = pytester.inline_run("--structlog-report-section=always")
+    [passed] = reprec.getreports("pytest_runtest_logreport")[1:2]
+    assert passed.passed
+    event = {"event": "from-passing-test", "level": "info"}
+    assert passed.sections == [("Captured structlog call", str(event))]
+
+
+def test_bad_ini_value(pytester, testfile):
+    pytester.makeini("[pytest]\nstructlog_report_section = sometimes")
+    result = pytester.runpytest()
+    assert result.ret != 0
+    result.stderr.fnmatch_lines(["*structlog_report_section configuration value*"])
@@ -0,0 +1,63 @@
+import structlog
+
+from pytest_structlog import Settings
+
+
+def my_processor(logger, method_name, event_dict):
+    return event_dict
+
+
+def test_use_processor_is_memoized(monkeypatch):
+    settings = Settings()
+    calls = []
+    original = settings._use_processor
+    monkeypatch.setattr(
+        settings, "_use_processor", lambda name: calls.append(name) or original(name)
+    )
+    assert settings.use_processor("TimeStamper") == (False, "")
+    assert settings.use_processor("TimeStamper") == (False, "")
+    assert settings.use_processor("add_log_level") == (True, "default-keep-list")
+    assert calls == ["TimeStamper", "add_log_level"]
+
+
+def test_invalidate():
+    settings = Settings()
+    assert settings.use_processor("my_processor") == (False, "")
+    settings.keep["config-file"].add("my_processor")
+    assert settings.use_processor("my_processor") == (False, "")
+    settings.invalidate()
+    assert settings.use_processor("my_processor") == (True, "config-file")
+    settings.mode = "evict"
+    settings.invalidate()
+    assert settings.use_processor("my_processor") == (True, "")
+
+
+def test_filter_processors_cached_by_identity():
+    settings = Settings()
+    time_stamper = structlog.processors.TimeStamper()
+    processors = [structlog.processors.add_log_level, time_stamper, my_processor]
+    result = settings.filter_processors(processors)
+    assert result == [structlog.processors.add_log_level]
+    assert settings.filter_processors(processors) is result
+    assert settings.filter_processors(list(processors)) is not result
+
+
+def test_filter_processors_notices_in_place_changes():
+    settings = Settings()
+    settings.keep["config-file"].add("my_processor")
+    processors = [structlog.processors.add_log_level]
+    result = settings.filter_processors(processors)
+    processors.append(my_processor)
+    assert settings.filter_processors(processors) == [
+        structlog.processors.add_log_level,
+        my_processor,
+    ]
+    assert result == [structlog.processors.add_log_level]
+
+
+def test_reset_invalidates():
+    settings = Settings()
+    settings.mode = "evict"
+    assert settings.filter_processors([my_processor]) == [my_processor]
+    settings.reset()
+    assert settings.filter_processors([my_processor]) == []
@@ -0,0 +1,179 @@
+import pytest
+
+
+@pytest.mark.parametrize("fixture", ["log_module", "log_session"])
+def test_events_are_per_test(pytester, fixture):
+    pytester.makepyfile(
+        f"""
+        import structlog
+
+        logger = structlog.get_logger()
+
+        def test_one({fixture}):
+            logger.info("one")
+            assert {fixture}.events == [{{"event": "one", "level": "info"}}]
+
+        def test_two({fixture}):
+            assert not {fixture}.events
+            logger.info("two")
+            assert {fixture}.has("two")
+            assert not {fixture}.has("one")
+
+        def test_fail({fixture}):
+            logger.info("three")
+            assert 0
+        """
+    )
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=2, failed=1)
+    result.stdout.fnmatch_lines(["*Captured structlog call*", "*'three'*"])
+    result.stdout.no_fnmatch_line("*'two'*")
+
+
+def test_log_module_configures_once_per_module(pytester):
+    pytester.makeconftest(
+        """
+        import structlog
+
+        import pytest_structlog
+
+        configured = []
+        original_prepare = pytest_structlog._prepare
+
+        def _prepare(capture):
+            configured.append(capture)
+            return original_prepare(capture)
+
+        pytest_structlog._prepare = _prepare
+        """
+    )
+    test = """
+        import structlog
+        from conftest import configured
+
+        def test_one(log_module):
+            structlog.get_logger().info("hello")
+            assert log_module.has("hello")
+
+        def test_two(log_module):
+            assert len(configured) == {n}
+            assert configured[-1] is log_module
+    """
+    pytester.makepyfile(test_a=test.format(n=1), test_b=test.format(n=2))
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=4)
+
+
+def test_log_session_configures_once(pytester):
+    test = """
+        import structlog
+
+        def test_one(log_session):
+            structlog.configure(processors=[])
+            structlog.get_logger().info("hello")
+            assert log_session.has("hello")
+
+        def test_two(log_session):
+            assert not log_session.events
+    """
+    pytester.makepyfile(test_a=test, test_b=test)
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=4)
+
+
+def test_structlog_restored_after_module(pytester):
+    pytester.makepyfile(
+        test_a="""
+        import structlog
+
+        def test_one(log_module):
+            assert structlog.configure.__name__ == "no_op"
+        """,
+        test_b="""
+        import structlog
+
+        def test_two():
+            assert structlog.configure.__name__ == "configure"
+            assert not any(
+                type(p).__name__ == "StructuredLogCapture"
+                for p in structlog.get_config()["processors"]
+            )
+        """,
+    )
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=2)
+
+
+def test_marker_on_module(pytester):
+    pytester.makepyfile(
+        """
+        import pytest
+        import structlog
+
+        pytestmark = pytest.mark.structlog(max_events=1)
+
+        def test_one(log_module):
+            structlog.get_logger().info("one")
+            structlog.get_logger().info("two")
+            assert log_module.events == [{"event": "two", "level": "info"}]
+        """
+    )
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1)
+
+
+@pytest.mark.parametrize("fixture", ["log_module", "log_session"])
+def test_marker_on_test_is_rejected(pytester, fixture):
+    pytester.makepyfile(
+        f"""
+        import pytest
+
+        def test_one({fixture}):
+            pass
+
+        @pytest.mark.structlog(max_events=2)
+        def test_two({fixture}):
+            pass
+        """
+    )
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1, errors=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*@pytest.mark.structlog(max_events=2) on test_marker_on_test_is_rejected.py"
+            f"::test_two differs from the marker the shared {fixture} capture*"
+        ]
+    )
+
+
+@pytest.mark.parametrize("fixture", ["log_module", "log_session"])
+def test_mixed_with_log(pytester, fixture):
+    pytester.makepyfile(
+        f"""
+        import structlog
+
+        logger = structlog.get_logger()
+
+        def test_shared({fixture}):
+            logger.info("a")
+            assert {fixture}.has("a")
+
+        def test_log(log):
+            logger.info("b")
+            assert log.has("b")
+
+        def test_no_fixture(request):
+            logger.info("c")
+            assert not hasattr(request.node, "structlog_events")
+
+        def test_shared_again({fixture}, log):
+            logger.info("d")
+            assert log.events == [{{"event": "d", "level": "info"}}]
+
+        def test_shared_last({fixture}):
+            logger.info("e")
+            assert {fixture}.events == [{{"event": "e", "level": "info"}}]
+        """
+    )
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=5)
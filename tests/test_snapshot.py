@@ -0,0 +1,128 @@
+from pytest_structlog import _snapshot_divergence
+from pytest_structlog import _snapshot_line
+
+TESTS = """
+import pytest
+import structlog
+
+logger = structlog.get_logger()
+
+def test_events(log):
+    logger.info("start", n={n})
+    for i in range(3):
+        logger.debug("step", i=i, timestamp="{ts}")
+    log.assert_matches_snapshot(ignore=["timestamp"])
+
+@pytest.mark.parametrize("x", ["a/b"])
+def test_named(log, x):
+    logger.info("named", x=x)
+    log.assert_matches_snapshot(name="first")
+    logger.info("more")
+    log.assert_matches_snapshot(name="second")
+"""
+
+
+def test_snapshot_written_then_compared(pytester):
+    pytester.makepyfile(test_snap=TESTS.format(n=1, ts="t1"))
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=2)
+    snapshots = pytester.path / "__snapshots__" / "test_snap"
+    assert sorted(p.name for p in snapshots.iterdir()) == [
+        "first.jsonl",
+        "second.jsonl",
+        "test_events.jsonl",
+    ]
+    lines = (snapshots / "test_events.jsonl").read_text().splitlines()
+    assert lines[0] == '{"event": "start", "level": "info", "n": 1}'
+    assert len(lines) == 4
+    assert "timestamp" not in lines[1]
+
+    # ignored keys may differ
+    pytester.makepyfile(test_snap=TESTS.format(n=1, ts="t2"))
+    pytester.runpytest().assert_outcomes(passed=2)
+
+    pytester.makepyfile(test_snap=TESTS.format(n=2, ts="t2"))
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*AssertionError: captured events differ from snapshot *test_events.jsonl"
+            " at event 0:",
+            '*expected: {"event": "start", "level": "info", "n": 1}',
+            '*actual:   {"event": "start", "level": "info", "n": 2}',
+            "*differing keys: 'n' (1 != 2)",
+            "*(4 events in snapshot, 4 captured; rerun with "
+            "--structlog-snapshot-update to accept the captured events)",
+        ]
+    )
+
+    pytester.runpytest("--structlog-snapshot-update").assert_outcomes(passed=2)
+    pytester.runpytest().assert_outcomes(passed=2)
+
+
+def test_snapshot_length_mismatch(pytester):
+    pytester.makepyfile("""
+        import structlog
+
+        def test_events(log):
+            for i in range(3):
+                structlog.get_logger().info("tick", i=i)
+            log.assert_matches_snapshot()
+        """)
+    pytester.runpytest().assert_outcomes(passed=1)
+    pytester.makepyfile("""
+        import structlog
+
+        def test_events(log):
+            for i in range(2):
+                structlog.get_logger().info("tick", i=i)
+            log.assert_matches_snapshot()
+        """)
+    result = pytester.runpytest()
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*differ from snapshot * at event 2:",
+            '*expected: {"event": "tick", "i": 2, "level": "info"}',
+            "*actual:   <no more events>",
+            "*(3 events in snapshot, 2 captured;*",
+        ]
+    )
+
+
+def test_ini_ignore(pytester):
+    pytester.makeini("[pytest]\nstructlog_snapshot_ignore = timestamp")
+    test = """
+        import structlog
+
+        def test_events(log):
+            structlog.get_logger().info("tick", timestamp={ts})
+            log.assert_matches_snapshot()
+    """
+    pytester.makepyfile(test.format(ts=1))
+    pytester.runpytest().assert_outcomes(passed=1)
+    pytester.makepyfile(test.format(ts=2))
+    pytester.runpytest().assert_outcomes(passed=1)
+
+
+def test_keys_ignored_after_writing():
+    stored = [_snapshot_line({"event": "a", "timestamp": 1}, frozenset())]
+    actual = [_snapshot_line({"event": "a", "timestamp": 2}, frozenset())]
+    assert _snapshot_divergence(stored, actual, frozenset()) == 0
+    ignored = frozenset({"timestamp"})
+    actual = [_snapshot_line({"event": "a", "timestamp": 2}, ignored)]
+    assert _snapshot_divergence(stored, actual, ignored) is None
+
+
+def test_stops_at_first_divergence(monkeypatch):
+    calls = []
+    expected = ['{"i": 0}', '{"i": 1}', '{"i": 2}']
+    actual = ['{"i": 0}', '{"i": 9}', '{"i": 9}']
+
+    def loads(s):
+        calls.append(s)
+        return {"i": int(s[6:-1])}
+
+    monkeypatch.setattr("pytest_structlog.json.loads", loads)
+    assert _snapshot_divergence(expected, actual, frozenset({"k"})) == 1
+    assert calls == ['{"i": 1}']
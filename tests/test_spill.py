@@ -0,0 +1,105 @@
+import tracemalloc
+
+import pytest
+import structlog
+
+from pytest_structlog import SpillEventList
+from pytest_structlog import StructuredLogCapture
+
+logger = structlog.get_logger()
+
+
+@pytest.mark.structlog(storage="spill")
+def test_spill_capture(log: StructuredLogCapture):
+    assert isinstance(log.events, SpillEventList)
+    assert not log.events
+    assert log.events == []
+    for i in range(1000):
+        logger.info("tick", i=i, data={"nested": [i]})
+    logger.warning("done", values=(1, 2), obj=object)
+    assert len(log.events) == 1001
+    assert log.events[0] == {
+        "event": "tick",
+        "i": 0,
+        "data": {"nested": [0]},
+        "level": "info",
+    }
+    assert log.events[-1] == {
+        "event": "done",
+        "values": [1, 2],
+        "obj": "<class 'object'>",
+        "level": "warning",
+    }
+    assert log.has("tick", i=999)
+    assert log.has("tick", i=5, data={"nested": [5]})
+    assert not log.has("tick", i=1000)
+    assert log.count("tick") == 1000
+    assert log.count("tick", level="info") == 1000
+    assert log.has("done", values=[1, 2])
+    assert log.events >= [log.info("tick", i=10, data={"nested": [10]})]
+    logger.info("after reading")
+    assert log.events[-1] == {"event": "after reading", "level": "info"}
+    assert log.has("after reading")
+
+
+@pytest.mark.structlog(storage="spill")
+def test_unrepresentable_events(log: StructuredLogCapture):
+    circular = []
+    circular.append(circular)
+    logger.info("keys", data={(1, 2): "x"}, n=1)
+    logger.info("circular", data=circular, n=2)
+    events = SpillEventList()
+    events.append({"event": "key", 1.5j: "x"})
+    assert log.events == [
+        {"event": "keys", "data": "{(1, 2): 'x'}", "n": 1, "level": "info"},
+        {"event": "circular", "data": "[[...]]", "n": 2, "level": "info"},
+    ]
+    assert events == [{"event": "key", "1.5j": "x"}]
+
+
+def test_candidates_prefilter():
+    events = SpillEventList()
+    events.append({"event": "a", "k": "v"})
+    events.append({"event": "b", "nested": {"event": "a"}})
+    events.append({"event": 'quote"d', "k": "ü"})
+    # nested pairs can't be told apart from top-level ones, they're checked later
+    assert list(events._candidates({"event": "a"})) == events[:2]
+    assert list(events._candidates({"event": "b"})) == [events[1]]
+    assert list(events._candidates({"event": 'quote"d', "k": "ü"})) == [events[2]]
+    assert list(events._candidates({"k": 1})) == events[:]
+
+
+def test_memory_stays_flat():
+    events = SpillEventList()
+    tracemalloc.start()
+    for i in range(5000):
+        events.append({"event": "tick", "payload": "x" * 200, "i": i})
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert size < 5000 * 50
+    events.clear()
+    assert len(events) == 0
+    events.append({"event": "new"})
+    assert events == [{"event": "new"}]
+    events.close()
+
+
+def test_closed_after_test(pytester):
+    pytester.makepyfile("""
+        import pytest
+        import structlog
+
+        events = []
+
+        @pytest.mark.structlog(storage="spill")
+        def test_one(log):
+            structlog.get_logger().info("hello")
+            events.append(log.events)
+            assert 0
+
+        def test_two():
+            assert events[0]._file.closed
+        """)
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(["*Captured structlog call*", "*'hello'*"])
@@ -0,0 +1,82 @@
+from unittest import mock
+
+import pytest
+
+from pytest_structlog import EventList
+from pytest_structlog import find_unmatched
+from pytest_structlog import is_subseq
+
+
+def make_events(n, indexed):
+    events = EventList({"event": f"e{i % 10}", "i": i} for i in range(n))
+    if indexed:
+        list(events._candidates({"event": "e0"}))
+        assert events._index is not None
+    return events
+
+
+@pytest.fixture(params=[False, True], ids=["scan", "index"])
+def events(request):
+    return make_events(1000, indexed=request.param)
+
+
+def test_subsequence(events):
+    expected = [{"event": "e3", "i": 3}, {"event": "e1", "i": 501}, events[-1]]
+    assert find_unmatched(expected, events) is None
+    assert events >= expected
+    assert expected <= events
+    assert events > expected
+
+
+def test_first_unmatched_index(events):
+    expected = [
+        {"event": "e3", "i": 3},
+        {"event": "e1", "i": 501},
+        {"event": "e0", "i": 500},
+        {"event": "e5", "i": 505},
+    ]
+    assert find_unmatched(expected, events) == 2
+    assert not events >= expected
+    assert find_unmatched([{"event": "e3", "i": 3}, {"event": "nope"}], events) == 1
+    assert find_unmatched([{"event": "e3", "i": 3}, {"i": 4}], events) == 1
+
+
+def test_duplicates(events):
+    expected = [{"event": "e1", "i": 1}] * 2
+    assert find_unmatched(expected, events) == 1
+    assert find_unmatched(expected[:1], events) is None
+
+
+def test_custom_equality_elements(events):
+    assert find_unmatched([mock.ANY] * 1000, events) is None
+    assert find_unmatched([mock.ANY] * 1001, events) == 1000
+    assert find_unmatched([{"event": "e2", "i": mock.ANY}] * 100, events) is None
+    assert find_unmatched([{"event": "e2", "i": mock.ANY}] * 101, events) == 100
+
+
+def test_events_without_event_key():
+    events = make_events(1000, indexed=True)
+    events.append({"i": -1})
+    assert find_unmatched([{"event": "e0", "i": 0}, {"i": -1}], events) is None
+
+
+def test_empty():
+    assert find_unmatched([], []) is None
+    assert find_unmatched([{}], []) == 0
+    assert is_subseq([], EventList())
+
+
+def test_length_short_circuit():
+    class Unsearchable(EventList):
+        def _find(self, item, start):
+            raise AssertionError("should not be searched")
+
+    events = Unsearchable([{"event": "a"}])
+    assert not events >= [{"event": "a"}, {"event": "a"}]
+    assert not [{"event": "a"}, {"event": "a"}] <= events
+    assert not events > [{"event": "a"}]
+
+
+def test_plain_iterables():
+    assert find_unmatched(iter([1, 3]), iter([1, 2, 3])) is None
+    assert find_unmatched([3, 1], (1, 2, 3)) == 1
@@ -0,0 +1,72 @@
+import pytest
+
+
+TESTS = """
+import structlog
+
+logger = structlog.get_logger()
+
+def test_quiet(log):
+    logger.debug("hello")
+
+def test_chatty(log):
+    for i in range(50):
+        logger.info("tick", i=i)
+    logger.warning("done")
+
+def test_medium(log):
+    for i in range(10):
+        logger.info("tock", i=i)
+
+def test_no_log_fixture():
+    pass
+"""
+
+
+def test_summary_report(pytester):
+    pytester.makepyfile(TESTS)
+    result = pytester.runpytest("--structlog-summary=2")
+    result.assert_outcomes(passed=4)
+    result.stdout.fnmatch_lines(
+        [
+            "*= structlog summary: top 2 tests by events =*",
+            "*51 events *s test_*.py::test_chatty",
+            "*levels: info: 50, warning: 1",
+            "*most logged: 'tick': 50, 'done': 1",
+            "*10 events *s test_*.py::test_medium",
+            "*levels: info: 10",
+            "62 events were logged by 3 tests.",
+        ]
+    )
+    result.stdout.no_fnmatch_line("*test_quiet*")
+
+
+def test_no_summary_by_default(pytester):
+    pytester.makepyfile(TESTS)
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=4)
+    result.stdout.no_fnmatch_line("*structlog summary*")
+
+
+def test_stats_not_attached_by_default(pytester):
+    pytester.makepyfile(TESTS)
+    reprec = pytester.inline_run()
+    for report in reprec.getreports("pytest_runtest_logreport"):
+        assert not hasattr(report, "structlog_stats")
+
+
+def test_summary_xdist(pytester):
+    pytest.importorskip("xdist")
+    pytester.makepyfile(TESTS)
+    result = pytester.runpytest("-n", "2", "--structlog-summary=5")
+    result.assert_outcomes(passed=4)
+    result.stdout.fnmatch_lines(
+        [
+            "*= structlog summary: top 5 tests by events =*",
+            "*51 events *s test_*.py::test_chatty",
+            "*levels: info: 50, warning: 1",
+            "*10 events *s test_*.py::test_medium",
+            "*1 events *s test_*.py::test_quiet",
+            "62 events were logged by 3 tests.",
+        ]
+    )
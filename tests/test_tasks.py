@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+import structlog
+
+from pytest_structlog import StructuredLogCapture
+
+
+logger = structlog.get_logger()
+
+
+async def worker(n):
+    for i in range(3):
+        logger.info("step", n=n, i=i)
+        await asyncio.sleep(0)
+    return asyncio.current_task()
+
+
+@pytest.mark.structlog(track_tasks=True)
+def test_events_for_task(log: StructuredLogCapture):
+    async def main():
+        logger.info("main")
+        tasks = [asyncio.ensure_future(worker(n)) for n in range(5)]
+        await asyncio.gather(*tasks)
+        return asyncio.current_task(), tasks
+
+    main_task, tasks = asyncio.run(main())
+    logger.info("outside any task")
+    assert len(log.events) == 17
+    assert log.events_for(main_task) == [log.info("main")]
+    for n, task in enumerate(tasks):
+        assert log.events_for(task) == [log.info("step", n=n, i=i) for i in range(3)]
+        assert log.has("step", n=n, task=task)
+        assert not log.has("step", n=(n + 1) % 5, task=task)
+        assert log.count("step", task=task) == 3
+    assert not log.has("main", task=tasks[0])
+    assert log.count("step") == 15
+
+
+def test_task_tracking_disabled(log: StructuredLogCapture):
+    async def main():
+        logger.info("main")
+        return asyncio.current_task()
+
+    task = asyncio.run(main())
+    assert log.has("main")
+    with pytest.raises(RuntimeError, match="task tracking is not enabled"):
+        log.has("main", task=task)
+
+
+@pytest.mark.structlog(track_tasks=True)
+def test_non_task_context_values(log: StructuredLogCapture):
+    logger.info("hello", task="cleanup")
+    assert log.has("hello", task="cleanup")
+
+
+def test_ini_option(pytester):
+    pytester.makeini("[pytest]\nstructlog_track_tasks = true")
+    pytester.makepyfile(
+        """
+        import asyncio
+        import structlog
+
+        def test_foo(log):
+            async def main():
+                structlog.get_logger().info("hi")
+                return asyncio.current_task()
+
+            task = asyncio.run(main())
+            assert log.events_for(task) == [{"event": "hi", "level": "info"}]
+        """
+    )
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1)
@@ -0,0 +1,68 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import structlog
+
+from pytest_structlog import StructuredLogCapture
+from pytest_structlog import ThreadedEventList
+
+
+logger = structlog.get_logger()
+
+
+def work(n):
+    for i in range(n):
+        logger.info("work", n=n, i=i)
+    return threading.get_ident()
+
+
+@pytest.mark.structlog(storage="threaded")
+def test_threaded_capture(log: StructuredLogCapture):
+    assert isinstance(log.events, ThreadedEventList)
+    logger.info("start")
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        idents = set(pool.map(work, range(1, 33)))
+    logger.info("end")
+    assert len(log.events) == sum(range(1, 33)) + 2
+    assert log.events[0] == {"event": "start", "level": "info"}
+    assert log.events[-1] == {"event": "end", "level": "info"}
+    assert log.count("work") == sum(range(1, 33))
+    assert log.has("work", n=32, i=31)
+    for n in 5, 32:
+        assert log.events >= [log.info("work", n=n, i=i) for i in range(n)]
+
+    records = log.events.records()
+    seqs = [seq for seq, _, _ in records]
+    assert seqs == sorted(seqs) == list(range(len(records)))
+    assert {tid for _, tid, _ in records} == idents | {threading.get_ident()}
+    main = log.events.for_thread(threading.get_ident())
+    assert main == [log.info("start"), log.info("end")]
+
+
+def test_merge_is_refreshed():
+    events = ThreadedEventList()
+    events.append({"event": "a"})
+    assert events == [{"event": "a"}]
+    thread = threading.Thread(target=events.append, args=({"event": "b"},))
+    thread.start()
+    thread.join()
+    events.append({"event": "c"})
+    assert events == [{"event": "a"}, {"event": "b"}, {"event": "c"}]
+    assert events[1:] == [{"event": "b"}, {"event": "c"}]
+    events.clear()
+    assert len(events) == 0
+    events.append({"event": "d"})
+    assert events == [{"event": "d"}]
+
+
+def test_reads_reuse_the_merge():
+    events = ThreadedEventList()
+    for i in range(10):
+        events.append({"event": "e", "i": i})
+    merged = events.records()
+    assert [events[i]["i"] for i in range(len(events))] == list(range(10))
+    assert events.records() is merged
+    events.append({"event": "e", "i": 10})
+    assert events.records() is not merged
+    assert events[-1] == {"event": "e", "i": 10}
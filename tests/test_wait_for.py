@@ -0,0 +1,119 @@
+import asyncio
+import threading
+import time
+
+import pytest
+import structlog
+
+from pytest_structlog import StructuredLogCapture
+
+
+logger = structlog.get_logger()
+
+
+def log_later(*events, delay=0.05):
+    def run():
+        for event in events:
+            time.sleep(delay)
+            logger.info(event, n=len(event))
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def test_wait_for_thread(log: StructuredLogCapture):
+    thread = log_later("one", "two", "three")
+    event = log.wait_for("three", timeout=5)
+    assert event == {"event": "three", "n": 5, "level": "info"}
+    assert log.events[-1] is event
+    thread.join()
+    assert not log._waiters
+
+
+def test_wait_for_already_logged(log: StructuredLogCapture):
+    logger.info("done", n=1)
+    assert log.wait_for("done", timeout=0) == {"event": "done", "n": 1, "level": "info"}
+
+
+def test_wait_for_context(log: StructuredLogCapture):
+    thread = log_later("abc", "abcd")
+    assert log.wait_for("abcd", n=4)["n"] == 4
+    thread.join()
+
+
+def test_wait_for_matcher(log: StructuredLogCapture):
+    thread = log_later("a", "bb", "ccc")
+    event = log.wait_for(log.matcher("ccc", n=lambda n: n > 2))
+    assert event["event"] == "ccc"
+    thread.join()
+    with pytest.raises(TypeError):
+        log.wait_for(log.matcher("ccc"), n=3)
+
+
+def test_wait_for_timeout(log: StructuredLogCapture):
+    logger.info("nope", n=4)
+    with pytest.raises(TimeoutError) as excinfo:
+        log.wait_for("nope", n=5, timeout=0.05)
+    assert "was logged within 0.05s" in str(excinfo.value)
+    assert "closest captured events:" in str(excinfo.value)
+    assert not log._waiters
+
+
+def test_wait_for_does_not_rescan(log: StructuredLogCapture, monkeypatch):
+    scans = []
+    original = StructuredLogCapture._first_match
+    monkeypatch.setattr(
+        StructuredLogCapture,
+        "_first_match",
+        lambda self, matcher: scans.append(matcher) or original(self, matcher),
+    )
+    thread = log_later(*"abcdefghij", delay=0.01)
+    log.wait_for("j")
+    thread.join()
+    assert len(scans) == 1
+
+
+@pytest.mark.structlog(storage="count")
+def test_wait_for_counted(log: StructuredLogCapture):
+    thread = log_later("one", "two")
+    assert log.wait_for("two")["n"] == 3
+    thread.join()
+    with pytest.raises(TimeoutError):
+        log.wait_for("two", timeout=0)
+
+
+def test_await_event(log: StructuredLogCapture):
+    async def worker():
+        await asyncio.sleep(0.01)
+        logger.info("async", n=1)
+
+    async def main():
+        task = asyncio.create_task(worker())
+        event = await log.await_event("async", timeout=5)
+        await task
+        return event
+
+    assert asyncio.run(main()) == {"event": "async", "n": 1, "level": "info"}
+    assert not log._waiters
+
+
+def test_await_event_from_thread(log: StructuredLogCapture):
+    async def main():
+        thread = log_later("one", "two")
+        event = await log.await_event(log.matcher("two"))
+        thread.join()
+        return event
+
+    assert asyncio.run(main())["event"] == "two"
+
+
+def test_await_event_timeout(log: StructuredLogCapture):
+    async def main():
+        logger.info("already")
+        assert await log.await_event("already") == {"event": "already", "level": "info"}
+        await log.await_event("never", timeout=0.01)
+
+    with pytest.raises(TimeoutError, match="no event {'event': 'never'}"):
+        asyncio.run(main())
+    assert not log._waiters
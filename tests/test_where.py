@@ -0,0 +1,134 @@
+import asyncio
+import logging
+from unittest import mock
+
+import pytest
+import structlog
+
+from pytest_structlog import EventList
+from pytest_structlog import EventQuery
+from pytest_structlog import StructuredLogCapture
+from pytest_structlog import TruncatedCaptureWarning
+
+logger = structlog.get_logger()
+
+
+def test_where(log: StructuredLogCapture):
+    logger.info("a", k="v", i=1)
+    logger.warning("b", k="v", i=2)
+    logger.info("a", k="w", i=3)
+    query = log.where(event="a")
+    assert isinstance(query, EventQuery)
+    assert query.count() == 2
+    assert query.exists()
+    assert query.first() == {"event": "a", "k": "v", "i": 1, "level": "info"}
+    assert query.values("i") == [1, 3]
+    assert list(query.where(k="w")) == [
+        {"event": "a", "k": "w", "i": 3, "level": "info"}
+    ]
+    assert log.where(k="v", level="warning").values("event") == ["b"]
+    assert not log.where(event="c").exists()
+    assert log.where(event="c").first() is None
+    assert log.where(event="c").count() == 0
+
+
+def test_where_is_lazy(log: StructuredLogCapture):
+    query = log.where(event="a")
+    assert query.count() == 0
+    logger.info("a")
+    assert query.count() == 1
+
+
+def test_chained_conflicting_values(log: StructuredLogCapture):
+    logger.info("a", k="v")
+    assert log.where(k="v").where(k="v").count() == 1
+    assert log.where(k="v").where(k="w").count() == 0
+
+
+def test_numeric_level(log: StructuredLogCapture):
+    logger.warning("a")
+    assert log.where(level=logging.WARNING).exists()
+    assert log.where(level="WARNING").exists()
+
+
+def test_level_is_normalized_everywhere(log: StructuredLogCapture):
+    logger.warning("a")
+    for level in logging.WARNING, "WARNING", "warning":
+        assert log.has("a", level=level)
+        assert log.count("a", level=level) == 1
+        assert log.has(log.matcher("a", level=level))
+        assert log.where(event="a", level=level).exists()
+        log.assert_has("a", level=level)
+        assert log.wait_for("a", level=level, timeout=0)["level"] == "warning"
+    assert not log.has("a", level=logging.INFO)
+    assert log.has(log.matcher("a", level=lambda level: level.startswith("warn")))
+    assert log.where(level=mock.ANY).count() == 1
+
+
+def test_values_skips_missing_keys(log: StructuredLogCapture):
+    logger.info("a", i=1)
+    logger.info("a")
+    assert log.where(event="a").values("i") == [1]
+
+
+def test_repr(log: StructuredLogCapture):
+    assert repr(log.where(event="a").where(i=1)) == "<EventQuery where(event='a', i=1)>"
+
+
+def test_uses_index():
+    capture = StructuredLogCapture()
+    capture.events.extend({"event": f"e{i % 10}", "i": i} for i in range(1000))
+    query = capture.where(event="e3")
+    assert query.values("i")[:3] == [3, 13, 23]
+    index = capture.events._index
+    assert index is not None
+    assert capture.where(event="e3", i=503).count() == 1
+    assert capture.events._index is index
+
+
+def test_single_pass(monkeypatch):
+    capture = StructuredLogCapture()
+    capture.events.extend({"event": "a", "i": i} for i in range(10))
+    calls = []
+    original = EventList._candidates
+    monkeypatch.setattr(
+        EventList,
+        "_candidates",
+        lambda self, context: calls.append(context) or original(self, context),
+    )
+    assert capture.where(event="a").where(i=3).count() == 1
+    assert calls == [{"event": "a", "i": 3}]
+
+
+@pytest.mark.structlog(storage="spill")
+def test_spill_storage(log: StructuredLogCapture):
+    logger.info("a", k="v")
+    logger.info("a", k="w")
+    assert log.where(event="a", k="w").count() == 1
+
+
+@pytest.mark.structlog(max_events=1)
+def test_truncated_warning(log: StructuredLogCapture):
+    logger.info("a")
+    logger.info("b")
+    with pytest.warns(TruncatedCaptureWarning):
+        assert log.where(event="a").count() == 0
+    with pytest.warns(TruncatedCaptureWarning):
+        assert not log.where(event="a").exists()
+
+
+@pytest.mark.structlog(track_tasks=True)
+def test_task(log: StructuredLogCapture):
+    async def work(name):
+        logger.info("work", name=name)
+        return asyncio.current_task()
+
+    async def main():
+        task = asyncio.create_task(work("x"))
+        await task
+        await asyncio.create_task(work("y"))
+        return task
+
+    task = asyncio.run(main())
+    assert log.where(event="work", task=task).values("name") == ["x"]
+    assert log.where(event="work").values("name") == ["x", "y"]